@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from re import Match, compile
 from typing import Literal
@@ -10,16 +11,31 @@ HUNK_HEADER_RE = compile(
     r"^@@ -(?P<old_start>\d+)(?:,(?P<old_count>\d+))? "
     r"\+(?P<new_start>\d+)(?:,(?P<new_count>\d+))? @@(?P<section>.*)$"
 )
+# Leading-whitespace-tolerant line classifiers used by DiffStats.
+BARE_EXCEPT_RE = compile(r"\s*except:")
+GUARD_STATEMENT_RE = compile(r"\s*(?:(?:raise|assert) .*\S|assert\s*$)")
 
 
 @dataclass(slots=True)
 class Line:
-    """A single line within a diff hunk."""
+    """A single line within a diff hunk.
+
+    ``kind`` is always one of the four literal strings below; hot loops compare it
+    with ``==`` rather than building membership sets.
+    """
 
     kind: Literal["context", "add", "delete", "meta"]
     content: str
     old_lineno: int | None
     new_lineno: int | None
+    _lowered: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def lowered(self) -> str:
+        """Lowercased content, computed once and shared across rules."""
+        if self._lowered is None:
+            self._lowered = self.content.lower()
+        return self._lowered
 
 
 @dataclass(slots=True)
@@ -46,6 +62,21 @@ class HunkHeader:
     section: str
 
 
+@dataclass(slots=True)
+class DiffStats:
+    """Per-file line statistics shared across rules."""
+
+    hunk_count: int = 0
+    added_lines: int = 0
+    deleted_lines: int = 0
+    bare_except_adds: int = 0
+    removed_guard_deletes: int = 0
+
+    @property
+    def changed_lines(self) -> int:
+        return self.added_lines + self.deleted_lines
+
+
 @dataclass(slots=True)
 class FileDiff:
     """A parsed file-level diff."""
@@ -54,6 +85,7 @@ class FileDiff:
     new_path: str | None
     hunks: list[Hunk] = field(default_factory=list)
     metadata: list[str] = field(default_factory=list)
+    _stats: DiffStats | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def path(self) -> str:
@@ -72,10 +104,24 @@ class FileDiff:
     def is_deleted_file(self) -> bool:
         return self.new_path == "/dev/null" and self.old_path not in {None, "/dev/null"}
 
+    @property
+    def stats(self) -> DiffStats:
+        """Line statistics, computed in a single walk on first access."""
+        if self._stats is None:
+            self._stats = _compute_stats(self.hunks)
+        return self._stats
+
 
 def parse_unified_diff(diff_text: str) -> list[FileDiff]:
     """Parse unified diff text into file/hunk/line models."""
-    files: list[FileDiff] = []
+    return list(parse_unified_diff_stream(diff_text.splitlines()))
+
+
+def parse_unified_diff_stream(lines: Iterable[str]) -> Iterator[FileDiff]:
+    """Yield each file of a unified diff as soon as its last line has been read.
+
+    ``lines`` must not carry line terminators (as produced by ``str.splitlines``).
+    """
     current_file: FileDiff | None = None
     current_hunk: Hunk | None = None
     old_lineno: int | None = None
@@ -87,16 +133,11 @@ def parse_unified_diff(diff_text: str) -> list[FileDiff]:
             current_file.hunks.append(current_hunk)
         current_hunk = None
 
-    def flush_file() -> None:
-        nonlocal current_file
-        flush_hunk()
-        if current_file is not None:
-            files.append(current_file)
-        current_file = None
-
-    for raw_line in diff_text.splitlines():
+    for raw_line in lines:
         if raw_line.startswith("diff --git "):
-            flush_file()
+            flush_hunk()
+            if current_file is not None:
+                yield current_file
             current_file = _start_file_from_diff_header(raw_line)
             continue
 
@@ -173,8 +214,35 @@ def parse_unified_diff(diff_text: str) -> list[FileDiff]:
         if current_file is not None:
             current_file.metadata.append(raw_line)
 
-    flush_file()
-    return files
+    flush_hunk()
+    if current_file is not None:
+        yield current_file
+
+
+def _compute_stats(hunks: list[Hunk]) -> DiffStats:
+    # Counters stay in locals and the matchers are bound once; this walk runs over
+    # every line of the diff, so per-line attribute lookups dominate its cost.
+    bare_except = BARE_EXCEPT_RE.match
+    guard_statement = GUARD_STATEMENT_RE.match
+    added = deleted = bare_except_adds = removed_guard_deletes = 0
+    for hunk in hunks:
+        for line in hunk.lines:
+            kind = line.kind
+            if kind == "add":
+                added += 1
+                if bare_except(line.content):
+                    bare_except_adds += 1
+            elif kind == "delete":
+                deleted += 1
+                if guard_statement(line.content):
+                    removed_guard_deletes += 1
+    return DiffStats(
+        hunk_count=len(hunks),
+        added_lines=added,
+        deleted_lines=deleted,
+        bare_except_adds=bare_except_adds,
+        removed_guard_deletes=removed_guard_deletes,
+    )
 
 
 def _start_file_from_diff_header(line: str) -> FileDiff:
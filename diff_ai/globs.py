@@ -0,0 +1,13 @@
+"""Path glob helpers shared by the CLI and profile rules."""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+
+
+def combine_globs(globs: list[str]) -> re.Pattern[str] | None:
+    """Compile globs into one regex matching any of them, or ``None`` when empty."""
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(glob) for glob in globs))
@@ -11,7 +11,7 @@ from typing import Any
 from diff_ai.diff_parser import FileDiff, Hunk, Line
 from diff_ai.git import get_file_at_revision
 from diff_ai.rules.base import Finding
-from diff_ai.scoring import ScoreResult
+from diff_ai.scoring import ScoreResult, parse_scope
 
 
 @dataclass(slots=True)
@@ -249,6 +249,8 @@ def build_snippets_markdown(
 
 def redact_text(text: str) -> str:
     """Redact common secret-like tokens from text outputs."""
+    if _SECRET_HINT_RE.search(text) is None:
+        return text
     redacted = text
     redacted = _PRIVATE_KEY_BLOCK_RE.sub("<redacted-private-key>", redacted)
     redacted = _BEARER_TOKEN_RE.sub("Bearer <redacted-token>", redacted)
@@ -356,7 +358,7 @@ def _risky_paths(result: ScoreResult) -> set[str]:
     for finding in result.findings:
         if finding.points <= 0:
             continue
-        scope_kind, path, _hunk = _parse_scope(finding.scope)
+        scope_kind, path, _hunk = parse_scope(finding.scope)
         if scope_kind in {"file", "hunk"} and path:
             risky.add(path)
     return risky
@@ -388,23 +390,6 @@ def _top_hunk_refs(result: ScoreResult, limit: int) -> list[tuple[str, int]]:
     return [(path, index) for path, index, _score in scored[:limit]]
 
 
-def _parse_scope(scope: str) -> tuple[str, str, int | None]:
-    if scope == "overall":
-        return ("overall", "", None)
-    if scope.startswith("file:"):
-        return ("file", scope[len("file:") :], None)
-    if scope.startswith("hunk:"):
-        remainder = scope[len("hunk:") :]
-        path, sep, index_text = remainder.rpartition(":")
-        if not sep:
-            return ("file", remainder, None)
-        try:
-            return ("hunk", path, int(index_text))
-        except ValueError:
-            return ("file", path or remainder, None)
-    return ("overall", "", None)
-
-
 def _snippet_for_hunk(*, path: str, hunk: Hunk, file_text: str) -> str:
     lines = file_text.splitlines()
     if not lines:
@@ -437,3 +422,9 @@ _ASSIGNMENT_SECRET_RE = re.compile(
 )
 _AWS_ACCESS_KEY_RE = re.compile(r"\bAKIA[0-9A-Z]{16}\b")
 _GITHUB_TOKEN_RE = re.compile(r"\bghp_[A-Za-z0-9]{20,}\b")
+# Literal fragments every pattern above requires. Text containing none of them is
+# returned as-is after one scan; anything else still goes through each substitution
+# in order, since a single alternation could let one match swallow part of another.
+_SECRET_HINT_RE = re.compile(
+    r"PRIVATE KEY-----|Bearer\s|AKIA|ghp_|(?i:api[_-]?key|secret|token|password)"
+)
@@ -79,16 +79,16 @@ class _PluginSpec:
     factory: type[PluginBase]
 
     def info(self) -> PluginInfo:
-        plugin = self.factory()
+        plugin_cls = self.factory
         return PluginInfo(
-            plugin_id=plugin.plugin_id,
-            rule_id=plugin.rule_id,
-            description=(plugin.__class__.__doc__ or "").strip(),
-            category=plugin.category,
-            packs=plugin.packs,
-            estimated_cost_seconds=plugin.estimated_cost_seconds,
-            modes=plugin.modes,
-            priority=plugin.priority,
+            plugin_id=plugin_cls.plugin_id,
+            rule_id=plugin_cls.rule_id,
+            description=(plugin_cls.__doc__ or "").strip(),
+            category=plugin_cls.category,
+            packs=plugin_cls.packs,
+            estimated_cost_seconds=plugin_cls.estimated_cost_seconds,
+            modes=plugin_cls.modes,
+            priority=plugin_cls.priority,
         )
 
 
@@ -232,7 +232,7 @@ class DeferredWorkMarkersPlugin(PluginBase):
                 for line in hunk.lines:
                     if line.kind != "add":
                         continue
-                    lowered = line.content.lower()
+                    lowered = line.lowered
                     if any(token in lowered for token in self._TOKENS):
                         markers.add(_clip_line(line.content))
 
@@ -369,7 +369,7 @@ class NetworkExposureProbePlugin(PluginBase):
                 for line in hunk.lines:
                     if line.kind != "add":
                         continue
-                    lowered = line.content.lower()
+                    lowered = line.lowered
                     if any(token in lowered for token in self._TOKENS):
                         hits.append(_clip_line(line.content))
             if not hits:
@@ -428,7 +428,7 @@ def _is_doc_path(path: str) -> bool:
 
 def _is_test_path(path: str) -> bool:
     lowered = path.lower()
-    name = PurePosixPath(lowered).name
+    name = lowered.rsplit("/", 1)[-1]
     return (
         lowered.startswith("tests/")
         or "/tests/" in lowered
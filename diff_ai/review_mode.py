@@ -58,17 +58,15 @@ def resolve_diff_input(
     """Resolve diff input based on explicit source and review mode."""
     if diff_file is not None:
         return ResolvedDiffInput(
-            diff_text=diff_file.read_text(encoding="utf-8"),
+            diff_text=diff_file.read_bytes().decode("utf-8"),
             input_source=f"diff_file:{diff_file}",
             base=base,
             head=head,
             review_mode=review_mode,
         )
     if stdin:
-        import sys
-
         return ResolvedDiffInput(
-            diff_text=sys.stdin.read(),
+            diff_text=_read_stdin(),
             input_source="stdin",
             base=base,
             head=head,
@@ -93,6 +91,17 @@ def resolve_diff_input(
     return _resolve_ai_task_diff(repo=repo, state_file=state_file)
 
 
+def _read_stdin() -> str:
+    import sys
+
+    # Decoding the raw bytes once skips the text layer's incremental decoder and
+    # newline translation; replaced streams without a buffer (e.g. StringIO) are
+    # read as text.
+    if not hasattr(sys.stdin, "buffer"):
+        return sys.stdin.read()
+    return sys.stdin.buffer.read().decode("utf-8")
+
+
 def save_ai_task_checkpoint(state_path: Path, tree_hash: str) -> None:
     """Persist AI-task checkpoint after a successful run."""
     updated_at = datetime.now(tz=UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
@@ -18,14 +18,16 @@ from diff_ai.rules.magnitude import MagnitudeRule
 from diff_ai.rules.profile_signals import ProfileSignalsRule
 from diff_ai.rules.test_signals import TestSignalsRule
 
-KNOWN_CATEGORIES = {
-    "logic",
-    "integration",
-    "test_adequacy",
-    "security",
-    "quality",
-    "profile",
-}
+KNOWN_CATEGORIES = frozenset(
+    {
+        "logic",
+        "integration",
+        "test_adequacy",
+        "security",
+        "quality",
+        "profile",
+    }
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -133,29 +135,33 @@ def build_rules(
     enabled_packs: list[str] | None = None,
     disabled_packs: list[str] | None = None,
     category_weights: dict[str, float] | None = None,
+    active_packs: set[str] | None = None,
 ) -> list[Rule]:
-    """Build rule instances applying objective, pack, and enable/disable filters."""
+    """Build rule instances applying objective, pack, and enable/disable filters.
+
+    Callers that already ran ``resolve_active_packs`` for the same objective and
+    pack overrides can pass the result as ``active_packs`` to skip resolving again.
+    """
     effective_profile = profile or ProfileConfig()
     specs = _ordered_rule_specs(effective_profile)
     registry = {spec.rule_id: spec for spec in specs}
     ordered_ids = [spec.rule_id for spec in specs]
-    disabled_set = set(disabled_rule_ids or [])
-    requested_ids = set(enabled_rule_ids or []) | set(disabled_rule_ids or [])
+    disabled_set = frozenset(disabled_rule_ids or ())
+    requested_ids = disabled_set.union(enabled_rule_ids or ())
 
     unknown = [rule_id for rule_id in requested_ids if rule_id not in registry]
     if unknown:
         joined = ", ".join(sorted(unknown))
         raise ValueError(f"Unknown rule ids: {joined}")
 
-    candidate_ids = _candidate_rule_ids(
-        specs=specs,
-        active_packs=resolve_active_packs(
+    if active_packs is None:
+        active_packs = resolve_active_packs(
             objective_name=objective_name,
             enabled_packs=enabled_packs,
             disabled_packs=disabled_packs,
-        ),
-    )
-    candidate_set = set(candidate_ids)
+        )
+    candidate_ids = _candidate_rule_ids(specs=specs, active_packs=active_packs)
+    candidate_set = frozenset(candidate_ids)
     if enabled_rule_ids is None:
         selected_ids = [
             rule_id
@@ -256,9 +262,8 @@ def resolve_active_packs(
 ) -> set[str]:
     """Resolve active packs from objective preset plus explicit pack overrides."""
     preset = _resolve_objective_preset(objective_name)
-    known_packs = _known_packs(_ordered_rule_specs(ProfileConfig()))
-    _validate_packs(enabled_packs or [], known_packs)
-    _validate_packs(disabled_packs or [], known_packs)
+    _validate_packs(enabled_packs or [], _KNOWN_PACKS)
+    _validate_packs(disabled_packs or [], _KNOWN_PACKS)
 
     active_packs = set(preset.default_packs)
     active_packs.update(enabled_packs or [])
@@ -275,18 +280,18 @@ def _resolve_objective_preset(name: str) -> _ObjectivePreset:
     return preset
 
 
-def _validate_packs(packs: list[str], known_packs: set[str]) -> None:
+def _validate_packs(packs: list[str], known_packs: frozenset[str]) -> None:
     unknown_packs = [pack for pack in packs if pack not in known_packs]
     if unknown_packs:
         joined = ", ".join(sorted(set(unknown_packs)))
         raise ValueError(f"Unknown rule packs: {joined}")
 
 
-def _known_packs(specs: list[_RuleSpec]) -> set[str]:
+def _known_packs(specs: list[_RuleSpec]) -> frozenset[str]:
     known: set[str] = set()
     for spec in specs:
         known.update(spec.packs)
-    return known
+    return frozenset(known)
 
 
 def _ordered_rule_specs(profile: ProfileConfig) -> list[_RuleSpec]:
@@ -342,7 +347,7 @@ def _ordered_rule_specs(profile: ProfileConfig) -> list[_RuleSpec]:
             packs=("integration",),
         ),
         _RuleSpec(
-            rule_id="profile_signals",
+            rule_id=ProfileSignalsRule.rule_id,
             factory=lambda: ProfileSignalsRule(profile),
             name="ProfileSignalsRule",
             description=(ProfileSignalsRule.__doc__ or "").strip(),
@@ -353,9 +358,8 @@ def _ordered_rule_specs(profile: ProfileConfig) -> list[_RuleSpec]:
 
 
 def _spec(rule_cls: type[Rule], *, category: str, packs: tuple[str, ...]) -> _RuleSpec:
-    instance = rule_cls()
     return _RuleSpec(
-        rule_id=instance.rule_id,
+        rule_id=rule_cls.rule_id,
         factory=rule_cls,
         name=rule_cls.__name__,
         description=(rule_cls.__doc__ or "").strip(),
@@ -380,3 +384,7 @@ def _dedupe(items: list[str]) -> list[str]:
         seen.add(item)
         output.append(item)
     return output
+
+
+# Pack membership is static across profiles, so resolve it once at import.
+_KNOWN_PACKS = _known_packs(_ordered_rule_specs(ProfileConfig()))
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import PurePosixPath
 
 from diff_ai.diff_parser import FileDiff
 from diff_ai.rules.base import Finding
 
 API_PATH_MARKERS = ("/api/", "/routes/", "/route/", "/controllers/", "/endpoints/")
+_API_PATH_RE = re.compile("|".join(re.escape(marker) for marker in API_PATH_MARKERS))
 SOURCE_SUFFIXES = {".py", ".js", ".ts", ".tsx", ".go", ".java", ".rb"}
 SIGNATURE_MARKERS = (
     "def ",
@@ -36,7 +38,8 @@ class ApiSurfaceRule:
             signature_changes = 0
             for hunk in file_diff.hunks:
                 for line in hunk.lines:
-                    if line.kind not in {"add", "delete"}:
+                    kind = line.kind
+                    if kind != "add" and kind != "delete":
                         continue
                     if _looks_like_signature(line.content):
                         signature_changes += 1
@@ -44,15 +47,14 @@ class ApiSurfaceRule:
             if signature_changes == 0:
                 continue
 
-            points = min(14, signature_changes * 2)
-            lowered = path.lower()
-            if any(marker in lowered for marker in API_PATH_MARKERS):
-                points += 4
+            is_api_path = _API_PATH_RE.search(path.lower()) is not None
+            # Churn caps at 14 and the API bonus is 4, so the total never exceeds 18.
+            points = min(14, signature_changes * 2) + (4 if is_api_path else 0)
 
             findings.append(
                 Finding(
                     rule_id=self.rule_id,
-                    points=min(18, points),
+                    points=points,
                     message="API or signature surface changed.",
                     evidence=f"{path} has {signature_changes} signature-level line changes.",
                     scope=f"file:{path}",
@@ -69,7 +71,7 @@ def _is_source_path(path: str) -> bool:
 
 def _is_test_path(path: str) -> bool:
     lowered = path.lower()
-    name = PurePosixPath(lowered).name
+    name = lowered.rsplit("/", 1)[-1]
     return (
         lowered.startswith("tests/")
         or "/tests/" in lowered
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import PurePosixPath
 
 from diff_ai.diff_parser import FileDiff
 from diff_ai.rules.base import Finding
 
 RISKY_CONFIG_TOKENS = ("debug=true", "allow_all", "allow-unauthenticated", "0.0.0.0")
+RUNTIME_CONFIG_FILENAMES = {"nginx.conf", "gunicorn.conf.py", "application.yml", "application.yaml"}
+_CONFIG_PATH_RE = re.compile(r"config/|settings/|docker-compose|k8s/|helm/")
 
 
 class ConfigChangesRule:
@@ -22,20 +25,18 @@ class ConfigChangesRule:
             if not _is_config_path(path):
                 continue
 
-            changed_lines = 0
+            changed_lines = file_diff.stats.changed_lines
+            if changed_lines == 0:
+                continue
+
             risky_hits = 0
             for hunk in file_diff.hunks:
                 for line in hunk.lines:
-                    if line.kind in {"add", "delete"}:
-                        changed_lines += 1
                     if line.kind == "add":
-                        lowered = line.content.lower()
+                        lowered = line.lowered
                         if any(token in lowered for token in RISKY_CONFIG_TOKENS):
                             risky_hits += 1
 
-            if changed_lines == 0:
-                continue
-
             points = 7 + min(4, risky_hits * 2)
             findings.append(
                 Finding(
@@ -55,10 +56,6 @@ def _is_config_path(path: str) -> bool:
     filename = PurePosixPath(lowered).name
     return (
         filename.startswith(".env")
-        or "config/" in lowered
-        or "settings/" in lowered
-        or "docker-compose" in lowered
-        or "k8s/" in lowered
-        or "helm/" in lowered
-        or filename in {"nginx.conf", "gunicorn.conf.py", "application.yml", "application.yaml"}
+        or filename in RUNTIME_CONFIG_FILENAMES
+        or _CONFIG_PATH_RE.search(lowered) is not None
     )
@@ -29,6 +29,12 @@ PATTERNS = [
     ),
 ]
 
+# Only tokens are scanned per added line; metadata is looked up on a match.
+_PATTERN_TOKENS = tuple(token for token, _points, _message, _suggestion in PATTERNS)
+_PATTERN_META = {
+    token: (points, message, suggestion) for token, points, message, suggestion in PATTERNS
+}
+
 
 class DangerousPatternsRule:
     """Finds risky language/runtime patterns in added lines."""
@@ -46,21 +52,25 @@ class DangerousPatternsRule:
                     if line.kind != "add":
                         continue
 
-                    lowered = line.content.lower()
-                    for token, points, message, suggestion in PATTERNS:
+                    lowered = line.lowered
+                    for token in _PATTERN_TOKENS:
+                        if token not in lowered:
+                            continue
                         key = (path, token)
-                        if token in lowered and key not in seen:
-                            seen.add(key)
-                            findings.append(
-                                Finding(
-                                    rule_id=self.rule_id,
-                                    points=points,
-                                    message=message,
-                                    evidence=f"{path}: `{_clip_line(line.content)}`",
-                                    scope=f"file:{path}",
-                                    suggestion=suggestion,
-                                )
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        points, message, suggestion = _PATTERN_META[token]
+                        findings.append(
+                            Finding(
+                                rule_id=self.rule_id,
+                                points=points,
+                                message=message,
+                                evidence=f"{path}: `{_clip_line(line.content)}`",
+                                scope=f"file:{path}",
+                                suggestion=suggestion,
                             )
+                        )
         return findings
 
 
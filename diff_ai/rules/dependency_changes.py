@@ -41,7 +41,9 @@ class DependencyChangesRule:
         for file_diff in files:
             path = file_diff.path
             filename = PurePosixPath(path).name.lower()
-            changed_lines = _changed_lines(file_diff)
+            if filename not in MANIFEST_FILES and filename not in LOCK_FILES:
+                continue
+            changed_lines = file_diff.stats.changed_lines
             if changed_lines == 0:
                 continue
 
@@ -83,12 +85,3 @@ class DependencyChangesRule:
             )
 
         return findings
-
-
-def _changed_lines(file_diff: FileDiff) -> int:
-    changed = 0
-    for hunk in file_diff.hunks:
-        for line in hunk.lines:
-            if line.kind in {"add", "delete"}:
-                changed += 1
-    return changed
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from pathlib import PurePosixPath
+import re
 
 from diff_ai.diff_parser import FileDiff
 from diff_ai.rules.base import Finding
 
+# Docs/tests directories, test_* / *_test.py modules, and markdown/rst files.
+_LOW_RISK_REMOVED_PATH_RE = re.compile(
+    r"(?:^|/)(?:docs|tests)/|(?:^|/)test_[^/]*$|(?:_test\.py|\.md|\.rst)$"
+)
+
 
 class DestructiveChangesRule:
     """Raises risk when deletions dominate or files are removed."""
@@ -21,9 +26,9 @@ class DestructiveChangesRule:
 
         for file_diff in files:
             path = file_diff.path
-            added, deleted = _count_changes(file_diff)
-            total_added += added
-            total_deleted += deleted
+            stats = file_diff.stats
+            total_added += stats.added_lines
+            total_deleted += stats.deleted_lines
 
             if file_diff.is_deleted_file and not _is_low_risk_removed_path(path):
                 deleted_files += 1
@@ -65,28 +70,5 @@ class DestructiveChangesRule:
         return findings
 
 
-def _count_changes(file_diff: FileDiff) -> tuple[int, int]:
-    added = 0
-    deleted = 0
-    for hunk in file_diff.hunks:
-        for line in hunk.lines:
-            if line.kind == "add":
-                added += 1
-            elif line.kind == "delete":
-                deleted += 1
-    return added, deleted
-
-
 def _is_low_risk_removed_path(path: str) -> bool:
-    lowered = path.lower()
-    name = PurePosixPath(lowered).name
-    return (
-        lowered.startswith("docs/")
-        or "/docs/" in lowered
-        or lowered.startswith("tests/")
-        or "/tests/" in lowered
-        or name.startswith("test_")
-        or name.endswith("_test.py")
-        or name.endswith(".md")
-        or name.endswith(".rst")
-    )
+    return _LOW_RISK_REMOVED_PATH_RE.search(path.lower()) is not None
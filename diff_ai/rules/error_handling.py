@@ -15,21 +15,9 @@ class ErrorHandlingRule:
         findings: list[Finding] = []
         for file_diff in files:
             path = file_diff.path
-            bare_except = 0
-            removed_guards = 0
-
-            for hunk in file_diff.hunks:
-                for line in hunk.lines:
-                    stripped = line.content.strip()
-                    if line.kind == "add" and stripped.startswith("except:"):
-                        bare_except += 1
-
-                    if line.kind == "delete" and (
-                        stripped.startswith("raise ")
-                        or stripped.startswith("assert ")
-                        or stripped == "assert"
-                    ):
-                        removed_guards += 1
+            stats = file_diff.stats
+            bare_except = stats.bare_except_adds
+            removed_guards = stats.removed_guard_deletes
 
             if bare_except > 0:
                 findings.append(
@@ -18,14 +18,10 @@ class MagnitudeRule:
         total_changed_lines = 0
         total_hunks = 0
         for file_diff in files:
-            path = file_diff.path
-            changed = 0
-            for hunk in file_diff.hunks:
-                total_hunks += 1
-                for line in hunk.lines:
-                    if line.kind in {"add", "delete"}:
-                        changed += 1
-            file_change_totals[path] = changed
+            stats = file_diff.stats
+            changed = stats.changed_lines
+            total_hunks += stats.hunk_count
+            file_change_totals[file_diff.path] = changed
             total_changed_lines += changed
 
         if total_changed_lines >= 300:
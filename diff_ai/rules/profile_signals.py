@@ -7,8 +7,11 @@ import re
 
 from diff_ai.config import ProfileConfig, ProfilePathSignal, ProfilePatternSignal
 from diff_ai.diff_parser import FileDiff
+from diff_ai.globs import combine_globs
 from diff_ai.rules.base import Finding
 
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+
 
 class ProfileSignalsRule:
     """Apply repo-specific path and pattern signals from config profile."""
@@ -17,38 +20,55 @@ class ProfileSignalsRule:
 
     def __init__(self, profile: ProfileConfig | None = None) -> None:
         self._profile = profile or ProfileConfig()
+        self._has_signals = self._profile.has_signals()
+        self._compiled_unsafe = [
+            (_compile_profile_regex(signal.regex), signal) for signal in self._profile.unsafe_added
+        ]
+        self._unsafe_prefilter = _combine_unsafe_patterns(self._profile.unsafe_added)
+        self._compiled_critical = _compile_path_signals(self._profile.critical)
+        self._compiled_sensitive = _compile_path_signals(self._profile.sensitive)
+        self._critical_re = combine_globs([signal.glob for signal in self._profile.critical])
+        self._sensitive_re = combine_globs([signal.glob for signal in self._profile.sensitive])
+        self._test_glob_re = combine_globs(self._profile.tests.test_globs)
+        self._required_for_re = combine_globs(self._profile.tests.required_for)
 
     def evaluate(self, files: list[FileDiff]) -> list[Finding]:
         findings: list[Finding] = []
-        if not self._profile.has_signals():
+        if not self._has_signals:
             return findings
 
-        changed_paths = [file_diff.path for file_diff in files]
-        test_changed = any(
-            _matches_any(file_diff.path, self._profile.tests.test_globs) for file_diff in files
-        )
-
+        # One pass classifies each path against the combined glob sets; per-signal
+        # path findings are only built for paths the combined regex accepts, and
+        # unconfigured categories (None regex, no unsafe signals) are skipped outright.
+        test_changed = False
+        required_matches: list[str] = []
+        checks_required = self._required_for_re is not None
         for file_diff in files:
             path = file_diff.path
-            findings.extend(
-                self._path_signal_findings(
-                    path,
-                    self._profile.critical,
-                    category="critical",
+            if checks_required:
+                if not test_changed and _matches_any(path, self._test_glob_re):
+                    test_changed = True
+                if _matches_any(path, self._required_for_re):
+                    required_matches.append(path)
+            if _matches_any(path, self._critical_re):
+                findings.extend(
+                    self._path_signal_findings(
+                        path,
+                        self._compiled_critical,
+                        category="critical",
+                    )
                 )
-            )
-            findings.extend(
-                self._path_signal_findings(
-                    path,
-                    self._profile.sensitive,
-                    category="sensitive",
+            if _matches_any(path, self._sensitive_re):
+                findings.extend(
+                    self._path_signal_findings(
+                        path,
+                        self._compiled_sensitive,
+                        category="sensitive",
+                    )
                 )
-            )
-            findings.extend(self._pattern_findings(file_diff, self._profile.unsafe_added))
+            if self._compiled_unsafe:
+                findings.extend(self._pattern_findings(file_diff, self._compiled_unsafe))
 
-        required_matches = [
-            path for path in changed_paths if _matches_any(path, self._profile.tests.required_for)
-        ]
         if required_matches and not test_changed:
             findings.append(
                 Finding(
@@ -69,13 +89,13 @@ class ProfileSignalsRule:
     def _path_signal_findings(
         self,
         path: str,
-        signals: list[ProfilePathSignal],
+        signals: list[tuple[re.Pattern[str], ProfilePathSignal]],
         *,
         category: str,
     ) -> list[Finding]:
         findings: list[Finding] = []
-        for signal in signals:
-            if not fnmatch.fnmatch(path, signal.glob):
+        for pattern, signal in signals:
+            if not pattern.match(path):
                 continue
             findings.append(
                 Finding(
@@ -92,18 +112,21 @@ class ProfileSignalsRule:
     def _pattern_findings(
         self,
         file_diff: FileDiff,
-        signals: list[ProfilePatternSignal],
+        signals: list[tuple[re.Pattern[str], ProfilePatternSignal]],
     ) -> list[Finding]:
         findings: list[Finding] = []
         seen: set[str] = set()
+        prefilter = self._unsafe_prefilter
         for hunk in file_diff.hunks:
             for line in hunk.lines:
                 if line.kind != "add":
                     continue
-                for signal in signals:
+                if prefilter is not None and prefilter.search(line.content) is None:
+                    continue
+                for pattern, signal in signals:
                     if signal.regex in seen:
                         continue
-                    if re.search(signal.regex, line.content):
+                    if pattern.search(line.content):
                         seen.add(signal.regex)
                         findings.append(
                             Finding(
@@ -120,5 +143,29 @@ class ProfileSignalsRule:
         return findings
 
 
-def _matches_any(path: str, globs: list[str]) -> bool:
-    return any(fnmatch.fnmatch(path, pattern) for pattern in globs)
+def _compile_profile_regex(regex: str) -> re.Pattern[str]:
+    try:
+        return re.compile(regex)
+    except re.error as exc:
+        raise ValueError(f"Invalid profile.patterns.unsafe_added regex /{regex}/: {exc}") from exc
+
+
+# The alternation only rejects lines matching no signal; hits are re-checked per
+# signal because one search reports just the leftmost alternative.
+def _combine_unsafe_patterns(signals: list[ProfilePatternSignal]) -> re.Pattern[str] | None:
+    if len(signals) < 2 or any(_BACKREFERENCE_RE.search(signal.regex) for signal in signals):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{signal.regex})" for signal in signals))
+    except re.error:
+        return None
+
+
+def _compile_path_signals(
+    signals: list[ProfilePathSignal],
+) -> list[tuple[re.Pattern[str], ProfilePathSignal]]:
+    return [(re.compile(fnmatch.translate(signal.glob)), signal) for signal in signals]
+
+
+def _matches_any(path: str, pattern: re.Pattern[str] | None) -> bool:
+    return pattern is not None and pattern.match(path) is not None
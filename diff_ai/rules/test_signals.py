@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from pathlib import PurePosixPath
-
 from diff_ai.diff_parser import FileDiff
 from diff_ai.rules.base import Finding
 
@@ -16,19 +14,18 @@ class TestSignalsRule:
     def evaluate(self, files: list[FileDiff]) -> list[Finding]:
         findings: list[Finding] = []
 
-        changed_test_paths = [
-            file_diff.path for file_diff in files if _is_test_path(file_diff.path)
-        ]
-        changed_code_paths = [
-            file_diff.path
-            for file_diff in files
-            if _is_code_path(file_diff.path) and not _is_test_path(file_diff.path)
-        ]
-        deleted_tests = [
-            file_diff.path
-            for file_diff in files
-            if file_diff.is_deleted_file and _is_test_path(file_diff.path)
-        ]
+        changed_test_paths: list[str] = []
+        changed_code_paths: list[str] = []
+        deleted_tests: list[str] = []
+        for file_diff in files:
+            path = file_diff.path
+            is_test, is_code = _classify_path(path)
+            if is_test:
+                changed_test_paths.append(path)
+                if file_diff.is_deleted_file:
+                    deleted_tests.append(path)
+            elif is_code:
+                changed_code_paths.append(path)
 
         if changed_code_paths and not changed_test_paths:
             findings.append(
@@ -84,20 +81,14 @@ class TestSignalsRule:
         return findings
 
 
-def _is_test_path(path: str) -> bool:
+def _classify_path(path: str) -> tuple[bool, bool]:
     lowered = path.lower()
-    pure_path = PurePosixPath(lowered)
-    name = pure_path.name
-    return (
+    name = lowered.rsplit("/", 1)[-1]
+    is_test = (
         lowered.startswith("tests/")
         or "/tests/" in lowered
         or name.startswith("test_")
         or name.endswith("_test.py")
     )
-
-
-def _is_code_path(path: str) -> bool:
-    lowered = path.lower()
-    if lowered.endswith(".md") or lowered.endswith(".rst") or lowered.endswith(".txt"):
-        return False
-    return "." in PurePosixPath(lowered).name
+    is_code = not lowered.endswith((".md", ".rst", ".txt")) and "." in name
+    return is_test, is_code
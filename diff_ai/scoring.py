@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
+from typing import Literal
 
 from diff_ai.diff_parser import FileDiff, parse_unified_diff
 from diff_ai.rules import default_rules, list_rule_info
@@ -10,6 +12,12 @@ from diff_ai.rules.base import Finding, Rule
 from diff_ai.scoring_backend import RuleHit, score_rule_hits
 
 _DEFAULT_RULE_CATEGORIES = {info.rule_id: info.category for info in list_rule_info()}
+_SCOPE_RE = re.compile(r"(file|hunk):(.*)", re.DOTALL)
+_RULE_HIT_SCOPES: dict[str, Literal["global", "file", "hunk"]] = {
+    "overall": "global",
+    "file": "file",
+    "hunk": "hunk",
+}
 
 
 @dataclass(slots=True)
@@ -33,7 +41,11 @@ class FileScore:
 
 @dataclass(slots=True)
 class ScoreResult:
-    """Top-level score output from deterministic rules."""
+    """Top-level score output from deterministic rules.
+
+    ``overall_score`` and ``final_score_0_100`` carry the same value; callers
+    constructing a result directly are expected to set both.
+    """
 
     overall_score: int
     files: list[FileScore]
@@ -45,12 +57,6 @@ class ScoreResult:
     final_score_0_100: int = 0
     reasons_topN: list[str] = field(default_factory=list)
 
-    def __post_init__(self) -> None:
-        if self.final_score_0_100 == 0 and self.overall_score != 0:
-            self.final_score_0_100 = self.overall_score
-        elif self.overall_score == 0 and self.final_score_0_100 != 0:
-            self.overall_score = self.final_score_0_100
-
 
 def score_diff_text(diff_text: str, rules: list[Rule] | None = None) -> ScoreResult:
     """Parse and score unified diff text."""
@@ -71,17 +77,30 @@ def score_files(files: list[FileDiff], rules: list[Rule] | None = None) -> Score
         all_findings.extend(rule.evaluate(files))
 
     rule_categories = _rule_categories(active_rules)
-    rule_hits = [
-        _finding_to_rule_hit(finding, rule_categories=rule_categories)
-        for finding in all_findings
-    ]
-    breakdown = score_rule_hits(rule_hits)
-
     scored_files = _init_file_scores(files)
     file_map = {scored_file.path: scored_file for scored_file in scored_files}
-
+    # Keyed by (path, index) so hunk-scoped findings need no bounds check.
+    hunk_map = {
+        (scored_file.path, index): hunk_score
+        for scored_file in scored_files
+        for index, hunk_score in enumerate(scored_file.hunks)
+    }
+
+    rule_hits: list[RuleHit] = []
     for finding in all_findings:
-        scope_kind, path, hunk_index = _parse_scope(finding.scope)
+        scope_kind, path, hunk_index = parse_scope(finding.scope)
+        rule_hits.append(
+            RuleHit(
+                id=finding.rule_id,
+                category=rule_categories.get(finding.rule_id, "unknown"),
+                points=finding.points,
+                scope=_RULE_HIT_SCOPES[scope_kind],
+                file_path=path or None,
+                hunk_id=hunk_index,
+                message=finding.message,
+                evidence=finding.evidence,
+            )
+        )
 
         if scope_kind == "overall":
             continue
@@ -93,13 +112,13 @@ def score_files(files: list[FileDiff], rules: list[Rule] | None = None) -> Score
         file_score.score += finding.points
         file_score.findings.append(finding)
 
-        if (
-            scope_kind == "hunk"
-            and hunk_index is not None
-            and 0 <= hunk_index < len(file_score.hunks)
-        ):
-            file_score.hunks[hunk_index].score += finding.points
-            file_score.hunks[hunk_index].findings.append(finding)
+        if scope_kind == "hunk" and hunk_index is not None:
+            hunk_score = hunk_map.get((path, hunk_index))
+            if hunk_score is not None:
+                hunk_score.score += finding.points
+                hunk_score.findings.append(finding)
+
+    breakdown = score_rule_hits(rule_hits)
 
     for file_score in scored_files:
         file_score.score = _clamp(file_score.score)
@@ -119,64 +138,46 @@ def score_files(files: list[FileDiff], rules: list[Rule] | None = None) -> Score
     )
 
 
-def _init_file_scores(files: list[FileDiff]) -> list[FileScore]:
-    scored_files: list[FileScore] = []
-    for file_diff in files:
-        scored_files.append(
-            FileScore(
-                path=file_diff.path,
-                hunks=[HunkScore(header=hunk.header) for hunk in file_diff.hunks],
-            )
-        )
-    return scored_files
-
-
-def _parse_scope(scope: str) -> tuple[str, str, int | None]:
+def parse_scope(scope: str) -> tuple[str, str, int | None]:
+    """Split a finding scope into ``(kind, path, hunk_index)``."""
     if scope == "overall":
         return ("overall", "", None)
-    if scope.startswith("file:"):
-        return ("file", scope[len("file:") :], None)
-    if scope.startswith("hunk:"):
-        remainder = scope[len("hunk:") :]
-        path, sep, index_text = remainder.rpartition(":")
-        if not sep:
-            return ("file", remainder, None)
-        try:
-            return ("hunk", path, int(index_text))
-        except ValueError:
-            return ("file", path or remainder, None)
-    return ("overall", "", None)
-
-
-def _finding_to_rule_hit(finding: Finding, *, rule_categories: dict[str, str]) -> RuleHit:
-    scope_kind, path, hunk_index = _parse_scope(finding.scope)
-    if scope_kind == "hunk":
-        normalized_scope = "hunk"
-    elif scope_kind == "file":
-        normalized_scope = "file"
-    else:
-        normalized_scope = "global"
-
-    return RuleHit(
-        id=finding.rule_id,
-        category=rule_categories.get(finding.rule_id, "unknown"),
-        points=finding.points,
-        scope=normalized_scope,
-        file_path=path or None,
-        hunk_id=hunk_index,
-        message=finding.message,
-        evidence=finding.evidence,
-    )
+    match = _SCOPE_RE.match(scope)
+    if match is None:
+        return ("overall", "", None)
+    kind, remainder = match.groups()
+    if kind == "file":
+        return ("file", remainder, None)
+    path, sep, index_text = remainder.rpartition(":")
+    if not sep:
+        return ("file", remainder, None)
+    try:
+        return ("hunk", path, int(index_text))
+    except ValueError:
+        return ("file", path or remainder, None)
+
+
+def _init_file_scores(files: list[FileDiff]) -> list[FileScore]:
+    return [
+        FileScore(
+            path=file_diff.path,
+            hunks=[HunkScore(header=hunk.header) for hunk in file_diff.hunks],
+        )
+        for file_diff in files
+    ]
 
 
 def _rule_categories(rules: list[Rule]) -> dict[str, str]:
-    categories = dict(_DEFAULT_RULE_CATEGORIES)
+    # Read-only for callers: the shared defaults are copied only when a custom rule adds one.
+    categories = _DEFAULT_RULE_CATEGORIES
     for rule in rules:
         rule_id = getattr(rule, "rule_id", None)
         if not isinstance(rule_id, str) or rule_id in categories:
             continue
         category = getattr(rule, "category", None)
         if isinstance(category, str) and category:
+            if categories is _DEFAULT_RULE_CATEGORIES:
+                categories = dict(categories)
             categories[rule_id] = category
     return categories
 
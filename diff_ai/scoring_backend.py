@@ -7,8 +7,12 @@ saturation and category overscoring.
 
 from __future__ import annotations
 
+import heapq
 import math
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Literal
 
 # Tuning note:
@@ -45,10 +49,14 @@ DEFAULT_RULE_CAPS: dict[str, float] = {
     "magnitude": 20.0,
 }
 
-CATEGORY_ALIASES: dict[str, str] = {
-    "quality": "style",
-    "profile": "integration",
-}
+# Read-only: the cached category tables pre-resolve these aliases to category
+# indices, so runtime edits would silently diverge from them.
+CATEGORY_ALIASES: Mapping[str, str] = MappingProxyType(
+    {
+        "quality": "style",
+        "profile": "integration",
+    }
+)
 
 DEFAULT_SCALE = 36.0
 
@@ -79,6 +87,20 @@ class ScoreBreakdown:
     reasons_topN: list[str]
 
 
+# (contribution, |points|, rule id, path, hunk id, -position, points, hit, category index)
+_RankedReason = tuple[float, float, str, str, int, int, float, RuleHit, int]
+
+
+@dataclass(frozen=True, slots=True)
+class _CategoryTable:
+    caps: dict[str, int]
+    ordered_categories: tuple[str, ...]
+    category_index: dict[str, int]
+    category_lookup: Mapping[str, int]
+    category_caps: tuple[float, ...]
+    category_weights: tuple[float, ...]
+
+
 def score_rule_hits(
     hits: list[RuleHit],
     *,
@@ -88,55 +110,92 @@ def score_rule_hits(
     scale: float = DEFAULT_SCALE,
     top_n: int = 5,
 ) -> ScoreBreakdown:
-    """Aggregate RuleHit signals into a calibrated score breakdown."""
+    """Aggregate RuleHit signals into a calibrated score breakdown.
+
+    The ``caps``, ``weights`` and ``rule_caps`` mappings are only read, never mutated.
+    """
     if scale <= 0:
         raise ValueError(f"scale must be positive, got {scale}")
 
-    active_caps = dict(DEFAULT_CATEGORY_CAPS if caps is None else caps)
-    active_weights = dict(DEFAULT_CATEGORY_WEIGHTS if weights is None else weights)
-    active_rule_caps = dict(DEFAULT_RULE_CAPS if rule_caps is None else rule_caps)
-    if "unknown" not in active_caps:
-        active_caps["unknown"] = DEFAULT_CATEGORY_CAPS["unknown"]
-    if "unknown" not in active_weights:
-        active_weights["unknown"] = DEFAULT_CATEGORY_WEIGHTS["unknown"]
-
-    ordered_categories = list(active_caps.keys())
-    raw_points_by_category = {category: 0 for category in ordered_categories}
+    if caps is None and weights is None:
+        table = _DEFAULT_CATEGORY_TABLE
+    else:
+        table = _category_table(
+            None if caps is None else tuple(caps.items()),
+            None if weights is None else tuple(weights.items()),
+        )
+    active_caps = table.caps
+    active_rule_caps = DEFAULT_RULE_CAPS if rule_caps is None else rule_caps
+    # Categories are integer-encoded so per-category sums accumulate into flat lists.
+    ordered_categories = table.ordered_categories
+    category_index = table.category_index
+    raw_points_by_index = [0] * len(ordered_categories)
     raw_points_total = 0
 
-    normalized_hits: list[tuple[RuleHit, str]] = []
+    hit_category_indices: list[int] = []
+    hit_rule_ids: list[str] = []
+    hit_points: list[int] = []
+    category_lookup = table.category_lookup
     for hit in hits:
-        normalized_category = normalize_category(hit.category, categories=active_caps)
-        normalized_hits.append((hit, normalized_category))
-        raw_points_total += hit.points
-        raw_points_by_category[normalized_category] += hit.points
-
-    adjusted_points_by_hit_index = _adjusted_points_by_hit(
-        normalized_hits=normalized_hits,
+        index = category_lookup.get(hit.category)
+        if index is None:
+            index = category_index[normalize_category(hit.category, categories=active_caps)]
+        points = hit.points
+        hit_category_indices.append(index)
+        hit_rule_ids.append(hit.id)
+        hit_points.append(points)
+        raw_points_total += points
+        raw_points_by_index[index] += points
+
+    adjusted_points = _adjusted_points_by_hit(
+        rule_ids=hit_rule_ids,
+        points=hit_points,
         rule_caps=active_rule_caps,
     )
 
-    scored_points_by_category = {category: 0.0 for category in ordered_categories}
-    for index, (_, category) in enumerate(normalized_hits):
-        scored_points_by_category[category] += adjusted_points_by_hit_index[index]
-
-    capped_points_by_category = {
-        category: min(scored_points_by_category[category], float(active_caps[category]))
-        for category in ordered_categories
-    }
-
-    overall_raw = 0.0
-    for category in ordered_categories:
-        weight = active_weights.get(category, active_weights["unknown"])
-        overall_raw += weight * capped_points_by_category[category]
+    adjusted_points_by_hit_index: Sequence[float]
+    if adjusted_points is None:
+        # No rule cap applied: integer sums are exact, so the per-hit float pass is skipped.
+        adjusted_points_by_hit_index = hit_points
+        scored_points_by_index = [float(points) for points in raw_points_by_index]
+    else:
+        adjusted_points_by_hit_index = adjusted_points
+        scored_points_by_index = [0.0] * len(ordered_categories)
+        for index, hit_adjusted in zip(hit_category_indices, adjusted_points, strict=True):
+            scored_points_by_index[index] += hit_adjusted
+
+    capped_points_by_index = [
+        min(scored_points, cap)
+        for scored_points, cap in zip(scored_points_by_index, table.category_caps, strict=True)
+    ]
+    overall_raw = sum(
+        weight * capped_points
+        for weight, capped_points in zip(
+            table.category_weights, capped_points_by_index, strict=True
+        )
+    )
 
-    transformed_score = 100.0 * (1.0 - math.exp(-overall_raw / scale))
-    final_score = int(round(_clamp(transformed_score, lower=0.0, upper=100.0)))
+    raw_points_by_category = dict(zip(ordered_categories, raw_points_by_index, strict=True))
+    capped_points_by_category = dict(zip(ordered_categories, capped_points_by_index, strict=True))
+
+    # 1 - exp(-x) rounds to exactly 1.0 well before x reaches 40, so saturated and
+    # empty inputs skip the exponential; negative x (net risk reductions) still uses it.
+    exponent = overall_raw / scale
+    if exponent == 0.0:
+        transformed_score = 0.0
+    elif exponent >= 40.0:
+        transformed_score = 100.0
+    else:
+        transformed_score = -100.0 * math.expm1(-exponent)
+    # The curve never exceeds 100; only net-negative totals need flooring at 0.
+    final_score = int(round(transformed_score)) if transformed_score > 0.0 else 0
 
     reasons_top_n = _build_top_reasons(
-        normalized_hits=normalized_hits,
+        hits=hits,
+        hit_category_indices=hit_category_indices,
         adjusted_points_by_hit_index=adjusted_points_by_hit_index,
-        weights=active_weights,
+        ordered_categories=ordered_categories,
+        category_weights=table.category_weights,
         top_n=top_n,
     )
 
@@ -162,71 +221,120 @@ def normalize_category(category: str, *, categories: dict[str, int] | None = Non
 
 def _build_top_reasons(
     *,
-    normalized_hits: list[tuple[RuleHit, str]],
-    adjusted_points_by_hit_index: dict[int, float],
-    weights: dict[str, float],
+    hits: list[RuleHit],
+    hit_category_indices: list[int],
+    adjusted_points_by_hit_index: Sequence[float],
+    ordered_categories: tuple[str, ...],
+    category_weights: tuple[float, ...],
     top_n: int,
 ) -> list[str]:
     if top_n <= 0:
         return []
 
-    ranked: list[tuple[float, float, RuleHit, str]] = []
-    for index, (hit, category) in enumerate(normalized_hits):
-        adjusted_points = adjusted_points_by_hit_index.get(index, float(hit.points))
-        contribution = weights.get(category, weights["unknown"]) * adjusted_points
-        ranked.append((contribution, adjusted_points, hit, category))
-
-    positives = [item for item in ranked if item[0] > 0]
-    source = positives if positives else ranked
-    source.sort(
-        key=lambda item: (
-            item[0],
-            abs(item[1]),
-            item[2].id,
-            item[2].file_path or "",
-            item[2].hunk_id if item[2].hunk_id is not None else -1,
-        ),
-        reverse=True,
-    )
+    # Items carry their full ranking key up front so the heap compares plain tuples.
+    # The negated position breaks exact ties in input order (as the stable sort did)
+    # and keeps comparisons from ever reaching the RuleHit.
+    positives: list[_RankedReason] = []
+    non_positives: list[_RankedReason] = []
+    for position, (hit, category_index, adjusted_points) in enumerate(
+        zip(hits, hit_category_indices, adjusted_points_by_hit_index, strict=True)
+    ):
+        contribution = category_weights[category_index] * adjusted_points
+        item = (
+            contribution,
+            abs(adjusted_points),
+            hit.id,
+            hit.file_path or "",
+            hit.hunk_id if hit.hunk_id is not None else -1,
+            -position,
+            adjusted_points,
+            hit,
+            category_index,
+        )
+        if contribution > 0:
+            positives.append(item)
+        else:
+            non_positives.append(item)
 
     reasons: list[str] = []
-    for _, adjusted_points, hit, category in source[:top_n]:
-        scope_bits: list[str] = []
-        if hit.file_path:
-            scope_bits.append(hit.file_path)
-        if hit.hunk_id is not None:
-            scope_bits.append(f"hunk {hit.hunk_id}")
-        scope_text = f" ({', '.join(scope_bits)})" if scope_bits else ""
+    for *_, adjusted_points, hit, category_index in heapq.nlargest(
+        top_n, positives or non_positives
+    ):
         rounded_points = int(round(adjusted_points))
-        signed_points = f"+{rounded_points}" if rounded_points >= 0 else str(rounded_points)
-        reasons.append(f"[{hit.id}] {signed_points} [{category}] {hit.message}{scope_text}")
+        category = ordered_categories[category_index]
+        scope_text = _reason_scope_text(hit.file_path, hit.hunk_id)
+        reasons.append(f"[{hit.id}] {rounded_points:+d} [{category}] {hit.message}{scope_text}")
     return reasons
 
 
-def _clamp(value: float, *, lower: float, upper: float) -> float:
-    return max(lower, min(upper, value))
+def _reason_scope_text(file_path: str | None, hunk_id: int | None) -> str:
+    if hunk_id is None:
+        return f" ({file_path})" if file_path else ""
+    if file_path:
+        return f" ({file_path}, hunk {hunk_id})"
+    return f" (hunk {hunk_id})"
+
+
+# Keyed on item tuples (None for the defaults) so repeated calls with the same
+# configuration reuse the resolved table instead of re-copying and re-indexing.
+@lru_cache(maxsize=8)
+def _category_table(
+    caps_items: tuple[tuple[str, int], ...] | None,
+    weights_items: tuple[tuple[str, float], ...] | None,
+) -> _CategoryTable:
+    caps = dict(DEFAULT_CATEGORY_CAPS if caps_items is None else caps_items)
+    weights = dict(DEFAULT_CATEGORY_WEIGHTS if weights_items is None else weights_items)
+    if "unknown" not in caps:
+        caps["unknown"] = DEFAULT_CATEGORY_CAPS["unknown"]
+    if "unknown" not in weights:
+        weights["unknown"] = DEFAULT_CATEGORY_WEIGHTS["unknown"]
+
+    ordered_categories = tuple(caps)
+    category_index = {category: index for index, category in enumerate(ordered_categories)}
+    # Configured names and aliases resolve to a category index with one lookup;
+    # other labels are normalized per hit in score_rule_hits and never stored here.
+    category_lookup = MappingProxyType(
+        {
+            raw: category_index[normalize_category(raw, categories=caps)]
+            for raw in (*caps, *CATEGORY_ALIASES)
+        }
+    )
+    unknown_weight = weights["unknown"]
+    return _CategoryTable(
+        caps=caps,
+        ordered_categories=ordered_categories,
+        category_index=category_index,
+        category_lookup=category_lookup,
+        category_caps=tuple(float(caps[category]) for category in ordered_categories),
+        category_weights=tuple(
+            weights.get(category, unknown_weight) for category in ordered_categories
+        ),
+    )
 
 
 def _adjusted_points_by_hit(
     *,
-    normalized_hits: list[tuple[RuleHit, str]],
+    rule_ids: list[str],
+    points: list[int],
     rule_caps: dict[str, float],
-) -> dict[int, float]:
-    if not normalized_hits:
-        return {}
-
-    hits_by_rule: dict[str, list[tuple[int, RuleHit]]] = {}
-    for index, (hit, _) in enumerate(normalized_hits):
-        hits_by_rule.setdefault(hit.id, []).append((index, hit))
-
-    adjusted: dict[int, float] = {}
-    for rule_id, entries in hits_by_rule.items():
-        cap = rule_caps.get(rule_id)
-        points_total = sum(entry.points for _, entry in entries)
-        factor = _rule_scale_factor(points_total=points_total, cap=cap)
-        for index, hit in entries:
-            adjusted[index] = hit.points * factor
-    return adjusted
+) -> list[float] | None:
+    # Rules without a cap always scale by 1.0, so only capped rules are totalled;
+    # None means no hit belongs to a capped rule and points pass through unchanged.
+    points_by_rule: dict[str, int] = {}
+    for rule_id, hit_points in zip(rule_ids, points, strict=True):
+        if rule_id in rule_caps:
+            points_by_rule[rule_id] = points_by_rule.get(rule_id, 0) + hit_points
+    if not points_by_rule:
+        return None
+
+    factor_by_rule = {
+        rule_id: _rule_scale_factor(points_total=points_total, cap=rule_caps[rule_id])
+        for rule_id, points_total in points_by_rule.items()
+    }
+    return [
+        hit_points * factor_by_rule.get(rule_id, 1.0)
+        for rule_id, hit_points in zip(rule_ids, points, strict=True)
+    ]
 
 
 def _rule_scale_factor(*, points_total: int, cap: float | None) -> float:
@@ -237,3 +345,6 @@ def _rule_scale_factor(*, points_total: int, cap: float | None) -> float:
     if magnitude_total <= cap:
         return 1.0
     return cap / magnitude_total
+
+
+_DEFAULT_CATEGORY_TABLE = _category_table(None, None)
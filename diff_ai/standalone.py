@@ -3,42 +3,50 @@
 from __future__ import annotations
 
 import argparse
-import fnmatch
+import heapq
+import io
 import json
-import shutil
+import re
 import sys
-import tempfile
 import zipfile
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from diff_ai import __version__
-from diff_ai.config import AppConfig, default_config_template, load_app_config
-from diff_ai.diff_parser import FileDiff, parse_unified_diff
-from diff_ai.git import GitError
-from diff_ai.handoff import (
-    PromptSpec,
-    build_findings_markdown,
-    build_prompt_markdown,
-    build_snippets_markdown,
-    redact_payload_strings,
-    redact_text,
-    select_diff_for_handoff,
-    truncate_text_to_bytes,
-)
-from diff_ai.plugins import PluginRun, list_plugin_info, schedule_plugin_rules
-from diff_ai.review_mode import (
-    REVIEW_MODE_AI_TASK,
-    REVIEW_MODE_MILESTONE,
-    normalize_review_mode,
-    resolve_diff_input,
-    save_ai_task_checkpoint,
-)
-from diff_ai.rules import build_rules, list_rule_info, resolve_active_packs
-from diff_ai.rules.base import Finding, Rule
-from diff_ai.scoring import FileScore, ScoreResult, score_files
+
+# Each command imports its own diff_ai dependencies so --help and light commands
+# skip loading the scoring stack.
+if TYPE_CHECKING:
+    from diff_ai.config import AppConfig
+    from diff_ai.diff_parser import FileDiff
+    from diff_ai.plugins import PluginRun
+    from diff_ai.rules.base import Finding, Rule
+    from diff_ai.scoring import FileScore, ScoreResult
+
+    _SubParsers = argparse._SubParsersAction[argparse.ArgumentParser]
+
+_FORMAT_CHOICES = frozenset({"human", "json"})
+_STYLE_CHOICES = frozenset({"concise", "thorough", "paranoid"})
+_PERSONA_CHOICES = frozenset({"reviewer", "security", "sre", "maintainer"})
+_INCLUDE_DIFF_CHOICES = frozenset({"full", "risky-only", "top-hunks"})
+_INCLUDE_SNIPPETS_CHOICES = frozenset({"none", "minimal", "risky-only"})
+# Scores at or above each threshold take the next label.
+_SEVERITY_THRESHOLDS = (40, 75)
+_SEVERITY_LABELS = ("LOW", "MEDIUM", "HIGH")
+# Fixes the JSON meta key order and carries the constant version; copied per payload.
+_META_PROTOTYPE: dict[str, Any] = {
+    "generated_at": None,
+    "base": None,
+    "head": None,
+    "input_source": None,
+    "version": __version__,
+}
 
 
 class CliUsageError(Exception):
@@ -65,8 +73,14 @@ class ScoreContext:
 
 def main(argv: list[str] | None = None) -> int:
     """Program entrypoint."""
-    parser = _build_parser()
-    args = parser.parse_args(argv)
+    raw_args = sys.argv[1:] if argv is None else argv
+    # A lone --version needs no parser at all.
+    if raw_args == ["--version"]:
+        print(__version__)
+        return 0
+
+    parser = _build_parser(raw_args[0] if raw_args else None)
+    args = parser.parse_args(raw_args)
 
     if args.version:
         print(__version__)
@@ -113,7 +127,7 @@ def _cmd_score(args: argparse.Namespace) -> int:
     app_config = _load_config_or_raise(args.repo, args.config_file)
     review_mode = _resolve_review_mode(args.review_mode, app_config.review.mode)
     output_format = (args.format or app_config.format).lower()
-    _validate_choice(output_format, {"human", "json"}, "--format")
+    _validate_choice(output_format, _FORMAT_CHOICES, "--format")
     _validate_diff_selection(args, review_mode=review_mode)
 
     score_ctx = _prepare_score_context(
@@ -131,17 +145,14 @@ def _cmd_score(args: argparse.Namespace) -> int:
     fail_threshold = args.fail_above if args.fail_above is not None else app_config.fail_above
 
     if output_format == "json":
-        print(
-            json.dumps(
-                _build_json_payload(
-                    score_ctx.result,
-                    input_source=score_ctx.input_source,
-                    base=score_ctx.resolved_base,
-                    head=score_ctx.resolved_head,
-                    plugin_runs=score_ctx.plugin_runs,
-                    review_mode=score_ctx.review_mode,
-                ),
-                sort_keys=True,
+        _print_json(
+            _build_json_payload(
+                score_ctx.result,
+                input_source=score_ctx.input_source,
+                base=score_ctx.resolved_base,
+                head=score_ctx.resolved_head,
+                plugin_runs=score_ctx.plugin_runs,
+                review_mode=score_ctx.review_mode,
             )
         )
     else:
@@ -153,6 +164,8 @@ def _cmd_score(args: argparse.Namespace) -> int:
 
 
 def _cmd_prompt(args: argparse.Namespace) -> int:
+    from diff_ai.handoff import PromptSpec, build_prompt_markdown, redact_text
+
     app_config = _load_config_or_raise(args.repo, args.config_file)
     review_mode = _resolve_review_mode(args.review_mode, app_config.review.mode)
     llm_defaults = app_config.llm
@@ -161,19 +174,19 @@ def _cmd_prompt(args: argparse.Namespace) -> int:
     resolved_style = _choice_or_default(
         value=args.style,
         default=llm_defaults.style,
-        allowed={"concise", "thorough", "paranoid"},
+        allowed=_STYLE_CHOICES,
         field_name="--style",
     )
     resolved_persona = _choice_or_default(
         value=args.persona,
         default=llm_defaults.persona,
-        allowed={"reviewer", "security", "sre", "maintainer"},
+        allowed=_PERSONA_CHOICES,
         field_name="--persona",
     )
     resolved_include_diff = _choice_or_default(
         value=args.include_diff,
         default=llm_defaults.include_diff,
-        allowed={"full", "risky-only", "top-hunks"},
+        allowed=_INCLUDE_DIFF_CHOICES,
         field_name="--include-diff",
     )
     resolved_target_score = (
@@ -233,11 +246,22 @@ def _cmd_prompt(args: argparse.Namespace) -> int:
             "review_mode": score_ctx.review_mode,
         },
     }
-    print(json.dumps(payload, sort_keys=True))
+    _print_json(payload)
     return 0
 
 
 def _cmd_bundle(args: argparse.Namespace) -> int:
+    from diff_ai.handoff import (
+        PromptSpec,
+        build_findings_markdown,
+        build_prompt_markdown,
+        build_snippets_markdown,
+        redact_payload_strings,
+        redact_text,
+        select_diff_for_handoff,
+        truncate_text_to_bytes,
+    )
+
     app_config = _load_config_or_raise(args.repo, args.config_file)
     review_mode = _resolve_review_mode(args.review_mode, app_config.review.mode)
     llm_defaults = app_config.llm
@@ -246,25 +270,25 @@ def _cmd_bundle(args: argparse.Namespace) -> int:
     resolved_style = _choice_or_default(
         value=args.style,
         default=llm_defaults.style,
-        allowed={"concise", "thorough", "paranoid"},
+        allowed=_STYLE_CHOICES,
         field_name="--style",
     )
     resolved_persona = _choice_or_default(
         value=args.persona,
         default=llm_defaults.persona,
-        allowed={"reviewer", "security", "sre", "maintainer"},
+        allowed=_PERSONA_CHOICES,
         field_name="--persona",
     )
     resolved_include_diff = _choice_or_default(
         value=args.include_diff,
         default=llm_defaults.include_diff,
-        allowed={"full", "risky-only", "top-hunks"},
+        allowed=_INCLUDE_DIFF_CHOICES,
         field_name="--include-diff",
     )
     resolved_include_snippets = _choice_or_default(
         value=args.include_snippets,
         default=llm_defaults.include_snippets,
-        allowed={"none", "minimal", "risky-only"},
+        allowed=_INCLUDE_SNIPPETS_CHOICES,
         field_name="--include-snippets",
     )
     resolved_target_score = (
@@ -288,24 +312,39 @@ def _cmd_bundle(args: argparse.Namespace) -> int:
         review_state_file=args.review_state_file,
     )
 
-    selected_diff = select_diff_for_handoff(
-        files=score_ctx.files,
-        result=score_ctx.result,
-        include_diff=resolved_include_diff,
-    )
-    selected_diff, _ = truncate_text_to_bytes(
-        selected_diff,
-        max_bytes=resolved_max_bytes,
-        marker="\n... [patch truncated to max-bytes] ...\n",
-    )
-    snippets_markdown = build_snippets_markdown(
-        repo=args.repo,
-        revision=score_ctx.resolved_head or "HEAD",
-        files=score_ctx.files,
-        result=score_ctx.result,
-        include_snippets=resolved_include_snippets,
-        max_bytes=resolved_max_bytes,
-    )
+    # Snippets run one `git show` per referenced hunk, so they are fetched on a worker
+    # thread while the in-memory artifacts are built here; those are pure Python and
+    # would not overlap with each other under the GIL.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        snippets_future = executor.submit(
+            build_snippets_markdown,
+            repo=args.repo,
+            revision=score_ctx.resolved_head or "HEAD",
+            files=score_ctx.files,
+            result=score_ctx.result,
+            include_snippets=resolved_include_snippets,
+            max_bytes=resolved_max_bytes,
+        )
+        selected_diff = select_diff_for_handoff(
+            files=score_ctx.files,
+            result=score_ctx.result,
+            include_diff=resolved_include_diff,
+        )
+        selected_diff, _ = truncate_text_to_bytes(
+            selected_diff,
+            max_bytes=resolved_max_bytes,
+            marker="\n... [patch truncated to max-bytes] ...\n",
+        )
+        findings_md = build_findings_markdown(score_ctx.result)
+        findings_payload = _build_json_payload(
+            score_ctx.result,
+            input_source=score_ctx.input_source,
+            base=score_ctx.resolved_base,
+            head=score_ctx.resolved_head,
+            plugin_runs=score_ctx.plugin_runs,
+            review_mode=score_ctx.review_mode,
+        )
+        snippets_markdown = snippets_future.result()
 
     prompt_md = build_prompt_markdown(
         result=score_ctx.result,
@@ -322,15 +361,6 @@ def _cmd_bundle(args: argparse.Namespace) -> int:
         ),
         snippets_markdown=snippets_markdown if resolved_include_snippets != "none" else None,
     )
-    findings_md = build_findings_markdown(score_ctx.result)
-    findings_payload = _build_json_payload(
-        score_ctx.result,
-        input_source=score_ctx.input_source,
-        base=score_ctx.resolved_base,
-        head=score_ctx.resolved_head,
-        plugin_runs=score_ctx.plugin_runs,
-        review_mode=score_ctx.review_mode,
-    )
 
     if resolved_redact:
         prompt_md = redact_text(prompt_md)
@@ -338,38 +368,39 @@ def _cmd_bundle(args: argparse.Namespace) -> int:
         selected_diff = redact_text(selected_diff)
         findings_payload = redact_payload_strings(findings_payload)
 
-    bundle_dir, archive_path = _prepare_bundle_destination(args.out, args.zip)
-    bundle_dir.mkdir(parents=True, exist_ok=True)
-    findings_json_path = bundle_dir / "findings.json"
-    findings_md_path = bundle_dir / "findings.md"
-    patch_path = bundle_dir / "patch.diff"
-    prompt_path = bundle_dir / "prompt.md"
-
-    findings_json_path.write_text(json.dumps(findings_payload, sort_keys=True), encoding="utf-8")
-    findings_md_path.write_text(findings_md, encoding="utf-8")
     patch_content = selected_diff if selected_diff.endswith("\n") else f"{selected_diff}\n"
-    patch_path.write_text(patch_content, encoding="utf-8")
-    prompt_path.write_text(prompt_md, encoding="utf-8")
-
-    output_path = str(bundle_dir)
-    if args.zip and archive_path is not None:
-        with zipfile.ZipFile(archive_path, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for item in ("findings.json", "findings.md", "patch.diff", "prompt.md"):
-                zf.write(bundle_dir / item, arcname=item)
-        shutil.rmtree(bundle_dir)
+    # Encoded once up front; both the zip and directory outputs write raw bytes.
+    artifacts = {
+        "findings.json": json.dumps(findings_payload).encode("utf-8"),
+        "findings.md": findings_md.encode("utf-8"),
+        "patch.diff": patch_content.encode("utf-8"),
+        "prompt.md": prompt_md.encode("utf-8"),
+    }
+
+    out_path = args.out.resolve()
+    if args.zip:
+        archive_path = out_path if out_path.suffix == ".zip" else out_path.with_suffix(".zip")
+        # Level 1 keeps most of deflate's savings on text at a fraction of the CPU time.
+        with zipfile.ZipFile(
+            archive_path, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zf:
+            for name, content in artifacts.items():
+                zf.writestr(name, content)
         output_path = str(archive_path)
+    else:
+        out_path.mkdir(parents=True, exist_ok=True)
+        for name, content in artifacts.items():
+            (out_path / name).write_bytes(content)
+        output_path = str(out_path)
 
     if args.format == "json":
-        print(
-            json.dumps(
-                {
-                    "output": output_path,
-                    "overall_score": score_ctx.result.overall_score,
-                    "target_score": resolved_target_score,
-                    "review_mode": score_ctx.review_mode,
-                },
-                sort_keys=True,
-            )
+        _print_json(
+            {
+                "output": output_path,
+                "overall_score": score_ctx.result.overall_score,
+                "target_score": resolved_target_score,
+                "review_mode": score_ctx.review_mode,
+            }
         )
     else:
         print(f"Bundle written to: {output_path}")
@@ -377,8 +408,10 @@ def _cmd_bundle(args: argparse.Namespace) -> int:
 
 
 def _cmd_rules(args: argparse.Namespace) -> int:
+    from diff_ai.rules import list_rule_info
+
     output_format = (args.format or "human").lower()
-    _validate_choice(output_format, {"human", "json"}, "--format")
+    _validate_choice(output_format, _FORMAT_CHOICES, "--format")
 
     app_config = _load_config_or_raise(args.repo, args.config_file)
     active_rules = _build_configured_rules_or_raise(app_config)
@@ -405,7 +438,7 @@ def _cmd_rules(args: argparse.Namespace) -> int:
             ],
             "meta": {"config_source": app_config.source},
         }
-        print(json.dumps(payload, sort_keys=True))
+        _print_json(payload)
         return 0
 
     lines = ["Available rules:"]
@@ -415,13 +448,15 @@ def _cmd_rules(args: argparse.Namespace) -> int:
             f"- {item.rule_id} [{status}] category={item.category} packs={list(item.packs)} "
             f"- {item.description}"
         )
-    print("\n".join(lines))
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
 def _cmd_plugins(args: argparse.Namespace) -> int:
+    from diff_ai.plugins import list_plugin_info
+
     output_format = (args.format or "human").lower()
-    _validate_choice(output_format, {"human", "json"}, "--format")
+    _validate_choice(output_format, _FORMAT_CHOICES, "--format")
 
     app_config = _load_config_or_raise(args.repo, args.config_file)
     plugin_info = list_plugin_info(include_builtin=app_config.plugins.include_builtin)
@@ -449,8 +484,8 @@ def _cmd_plugins(args: argparse.Namespace) -> int:
                     "estimated_cost_seconds": item.estimated_cost_seconds,
                     "modes": list(item.modes),
                     "priority": item.priority,
-                    "schedule": runs_by_id[item.plugin_id].to_dict()
-                    if item.plugin_id in runs_by_id
+                    "schedule": run.to_dict()
+                    if (run := runs_by_id.get(item.plugin_id)) is not None
                     else None,
                 }
                 for item in plugin_info
@@ -463,7 +498,7 @@ def _cmd_plugins(args: argparse.Namespace) -> int:
                 "active_packs": active_packs,
             },
         }
-        print(json.dumps(payload, sort_keys=True))
+        _print_json(payload)
         return 0
 
     lines = ["Available plugins:"]
@@ -482,13 +517,13 @@ def _cmd_plugins(args: argparse.Namespace) -> int:
         lines.append(f"active_packs={active_packs}")
         lines.append(f"objective_mode={app_config.objective.mode}")
         lines.append(f"objective_budget_seconds={app_config.objective.budget_seconds}")
-    print("\n".join(lines))
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
 def _cmd_config(args: argparse.Namespace) -> int:
     output_format = (args.format or "human").lower()
-    _validate_choice(output_format, {"human", "json"}, "--format")
+    _validate_choice(output_format, _FORMAT_CHOICES, "--format")
 
     app_config = _load_config_or_raise(args.repo, args.config_file)
     active_rules = _build_configured_rules_or_raise(app_config)
@@ -496,7 +531,7 @@ def _cmd_config(args: argparse.Namespace) -> int:
     payload["active_rule_ids"] = [rule.rule_id for rule in active_rules]
 
     if output_format == "json":
-        print(json.dumps(payload, sort_keys=True))
+        _print_json(payload)
         return 0
 
     lines = [
@@ -521,23 +556,25 @@ def _cmd_config(args: argparse.Namespace) -> int:
         f"- review.state_file: {payload['review']['state_file']}",
         f"- active_rule_ids: {payload['active_rule_ids']}",
     ]
-    print("\n".join(lines))
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
 def _cmd_config_init(args: argparse.Namespace) -> int:
+    from diff_ai.config import default_config_template
+
     out_path = args.out.resolve()
     if out_path.exists() and not args.force:
         raise CliUsageError(f"refusing to overwrite existing file: {out_path} (use --force)")
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(default_config_template(), encoding="utf-8")
+    out_path.write_text(default_config_template(), encoding="utf-8", newline="")
     print(f"Wrote starter config: {out_path}")
     return 0
 
 
 def _cmd_config_validate(args: argparse.Namespace) -> int:
     output_format = (args.format or "human").lower()
-    _validate_choice(output_format, {"human", "json"}, "--format")
+    _validate_choice(output_format, _FORMAT_CHOICES, "--format")
 
     app_config = _load_config_or_raise(args.repo, args.config_file)
     active_rules = _build_configured_rules_or_raise(app_config)
@@ -547,7 +584,7 @@ def _cmd_config_validate(args: argparse.Namespace) -> int:
         "active_rule_ids": [rule.rule_id for rule in active_rules],
     }
     if output_format == "json":
-        print(json.dumps(payload, sort_keys=True))
+        _print_json(payload)
         return 0
 
     print(
@@ -562,14 +599,27 @@ def _cmd_config_validate(args: argparse.Namespace) -> int:
     return 0
 
 
-def _build_parser() -> argparse.ArgumentParser:
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="diff-ai",
         description="Analyze git diffs and produce deterministic risk scores.",
     )
     parser.add_argument("--version", action="store_true", help="Show version and exit.")
-    subparsers = parser.add_subparsers(dest="command")
+    # The metavar lists every command so usage lines stay complete when only one
+    # subparser is registered.
+    subparsers = parser.add_subparsers(dest="command", metavar=_COMMANDS_METAVAR)
+
+    # A known command only needs its own subparser; anything else (help, version,
+    # typos) gets the full parser so listings and error messages stay complete.
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for add_subparser in _SUBPARSER_BUILDERS.values():
+            add_subparser(subparsers)
+    return parser
+
 
+def _add_score_parser(subparsers: _SubParsers) -> None:
     score = subparsers.add_parser("score", help="Score a diff and output risk summary.")
     _add_diff_input_args(score)
     _add_config_arg(score)
@@ -581,9 +631,13 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Exit nonzero if overall score is above this value.",
     )
 
+
+def _add_explain_parser(subparsers: _SubParsers) -> None:
     explain = subparsers.add_parser("explain", help="Explain score details in depth.")
     explain.set_defaults(command="explain")
 
+
+def _add_prompt_parser(subparsers: _SubParsers) -> None:
     prompt = subparsers.add_parser("prompt", help="Generate a paste-ready LLM prompt.")
     _add_diff_input_args(prompt)
     _add_config_arg(prompt)
@@ -598,6 +652,8 @@ def _build_parser() -> argparse.ArgumentParser:
     prompt.set_defaults(redact_secrets=None)
     prompt.add_argument("--format", default="markdown", choices=["markdown", "json"])
 
+
+def _add_bundle_parser(subparsers: _SubParsers) -> None:
     bundle = subparsers.add_parser("bundle", help="Create an offline LLM handoff bundle.")
     _add_diff_input_args(bundle)
     _add_config_arg(bundle)
@@ -620,11 +676,15 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     bundle.add_argument("--zip", action="store_true", help="Write bundle as zip file.")
 
+
+def _add_rules_parser(subparsers: _SubParsers) -> None:
     rules = subparsers.add_parser("rules", help="List available scoring rules.")
     _add_repo_arg(rules)
     _add_config_arg(rules)
     rules.add_argument("--format", default="human", help="Output format: human|json.")
 
+
+def _add_plugins_parser(subparsers: _SubParsers) -> None:
     plugins = subparsers.add_parser("plugins", help="List plugins and scheduling decisions.")
     _add_repo_arg(plugins)
     _add_config_arg(plugins)
@@ -634,11 +694,15 @@ def _build_parser() -> argparse.ArgumentParser:
     dry_run_group.add_argument("--no-dry-run", dest="dry_run", action="store_false")
     plugins.set_defaults(dry_run=True)
 
+
+def _add_config_parser(subparsers: _SubParsers) -> None:
     config = subparsers.add_parser("config", help="Show resolved configuration.")
     _add_repo_arg(config)
     _add_config_arg(config)
     config.add_argument("--format", default="human", help="Output format: human|json.")
 
+
+def _add_config_init_parser(subparsers: _SubParsers) -> None:
     config_init = subparsers.add_parser("config-init", help="Create starter config TOML.")
     config_init.add_argument(
         "--out",
@@ -648,6 +712,8 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     config_init.add_argument("--force", action="store_true", help="Overwrite if file exists.")
 
+
+def _add_config_validate_parser(subparsers: _SubParsers) -> None:
     config_validate = subparsers.add_parser(
         "config-validate", help="Validate config file and report active rules."
     )
@@ -661,7 +727,20 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     config_validate.add_argument("--format", default="human", help="Output format: human|json.")
 
-    return parser
+
+# Insertion order is the order commands are listed in --help.
+_SUBPARSER_BUILDERS: dict[str, Callable[[_SubParsers], None]] = {
+    "score": _add_score_parser,
+    "explain": _add_explain_parser,
+    "prompt": _add_prompt_parser,
+    "bundle": _add_bundle_parser,
+    "rules": _add_rules_parser,
+    "plugins": _add_plugins_parser,
+    "config": _add_config_parser,
+    "config-init": _add_config_init_parser,
+    "config-validate": _add_config_validate_parser,
+}
+_COMMANDS_METAVAR = "{" + ",".join(_SUBPARSER_BUILDERS) + "}"
 
 
 def _add_repo_arg(parser: argparse.ArgumentParser) -> None:
@@ -694,17 +773,20 @@ def _add_diff_input_args(parser: argparse.ArgumentParser) -> None:
 
 
 def _validate_diff_selection(args: argparse.Namespace, *, review_mode: str) -> None:
+    from diff_ai.review_mode import REVIEW_MODE_AI_TASK, REVIEW_MODE_MILESTONE
+
     if args.diff_file is not None and args.stdin:
         raise CliUsageError("use either --diff-file or --stdin, not both")
-    if (args.base is None) ^ (args.head is None):
+    has_base = args.base is not None
+    if has_base != (args.head is not None):
         raise CliUsageError("provide both --base and --head together")
-    if review_mode == REVIEW_MODE_AI_TASK and args.base is not None:
+    if review_mode == REVIEW_MODE_AI_TASK and has_base:
         raise CliUsageError("ai-task mode does not use --base/--head; use milestone mode")
     if review_mode not in {REVIEW_MODE_AI_TASK, REVIEW_MODE_MILESTONE}:
         raise CliUsageError("review mode must be one of: ai-task, milestone")
 
 
-def _validate_choice(value: str, allowed: set[str], field_name: str) -> None:
+def _validate_choice(value: str, allowed: frozenset[str], field_name: str) -> None:
     if value not in allowed:
         raise CliUsageError(f"{field_name} must be one of: {', '.join(sorted(allowed))}")
 
@@ -713,7 +795,7 @@ def _choice_or_default(
     *,
     value: str | None,
     default: str,
-    allowed: set[str],
+    allowed: frozenset[str],
     field_name: str,
 ) -> str:
     resolved = (value or default).lower()
@@ -722,6 +804,8 @@ def _choice_or_default(
 
 
 def _resolve_review_mode(raw_mode: str | None, config_mode: str) -> str:
+    from diff_ai.review_mode import normalize_review_mode
+
     try:
         return normalize_review_mode(raw_mode, default=config_mode)
     except ValueError as exc:
@@ -729,13 +813,19 @@ def _resolve_review_mode(raw_mode: str | None, config_mode: str) -> str:
 
 
 def _load_config_or_raise(repo: Path, config_file: Path | None = None) -> AppConfig:
+    from diff_ai.config import load_app_config
+
     try:
         return load_app_config(repo, config_path=config_file)
     except ValueError as exc:
         raise CliUsageError(str(exc)) from exc
 
 
-def _build_configured_rules_or_raise(app_config: AppConfig) -> list[Rule]:
+def _build_configured_rules_or_raise(
+    app_config: AppConfig, *, active_packs: set[str] | None = None
+) -> list[Rule]:
+    from diff_ai.rules import build_rules
+
     try:
         return build_rules(
             enabled_rule_ids=app_config.rule_enable,
@@ -745,12 +835,15 @@ def _build_configured_rules_or_raise(app_config: AppConfig) -> list[Rule]:
             enabled_packs=app_config.objective.enable_packs,
             disabled_packs=app_config.objective.disable_packs,
             category_weights=app_config.objective.category_weights,
+            active_packs=active_packs,
         )
     except ValueError as exc:
         raise CliUsageError(str(exc)) from exc
 
 
 def _resolve_active_packs_or_raise(app_config: AppConfig) -> set[str]:
+    from diff_ai.rules import resolve_active_packs
+
     try:
         return resolve_active_packs(
             objective_name=app_config.objective.name,
@@ -764,6 +857,8 @@ def _resolve_active_packs_or_raise(app_config: AppConfig) -> set[str]:
 def _schedule_plugins_or_raise(
     app_config: AppConfig, *, active_packs: set[str]
 ) -> tuple[list[Rule], list[PluginRun]]:
+    from diff_ai.plugins import schedule_plugin_rules
+
     try:
         return schedule_plugin_rules(
             include_builtin=app_config.plugins.include_builtin,
@@ -790,6 +885,12 @@ def _prepare_score_context(
     review_mode: str,
     review_state_file: Path | None,
 ) -> ScoreContext:
+    from diff_ai.diff_parser import parse_unified_diff_stream
+    from diff_ai.git import GitError
+    from diff_ai.globs import combine_globs
+    from diff_ai.review_mode import resolve_diff_input, save_ai_task_checkpoint
+    from diff_ai.scoring import score_files
+
     try:
         resolved_diff = resolve_diff_input(
             diff_file=diff_file,
@@ -805,14 +906,22 @@ def _prepare_score_context(
     except ValueError as exc:
         raise CliUsageError(str(exc)) from exc
 
-    include_patterns = include if include is not None else app_config.include
-    exclude_patterns = exclude if exclude is not None else app_config.exclude
-    rules = _build_configured_rules_or_raise(app_config)
+    include_re = combine_globs(include if include is not None else app_config.include)
+    exclude_re = combine_globs(exclude if exclude is not None else app_config.exclude)
     active_packs = _resolve_active_packs_or_raise(app_config)
+    rules = _build_configured_rules_or_raise(app_config, active_packs=active_packs)
     plugin_rules, plugin_runs = _schedule_plugins_or_raise(app_config, active_packs=active_packs)
 
-    files = parse_unified_diff(resolved_diff.diff_text)
-    filtered_files = _filter_files(files, includes=include_patterns, excludes=exclude_patterns)
+    selected_text = _select_diff_segments(
+        resolved_diff.diff_text, include_re=include_re, exclude_re=exclude_re
+    )
+    # Files are filtered as the parser yields them, so unselected files never
+    # accumulate in a list.
+    filtered_files = _filter_files(
+        parse_unified_diff_stream(selected_text.splitlines()),
+        include_re=include_re,
+        exclude_re=exclude_re,
+    )
     result = score_files(filtered_files, rules=[*rules, *plugin_rules])
 
     if resolved_diff.checkpoint_tree and resolved_diff.state_path:
@@ -831,26 +940,74 @@ def _prepare_score_context(
 
 
 def _filter_files(
-    files: list[FileDiff], *, includes: list[str], excludes: list[str]
+    files: Iterable[FileDiff],
+    *,
+    include_re: re.Pattern[str] | None,
+    exclude_re: re.Pattern[str] | None,
 ) -> list[FileDiff]:
-    filtered: list[FileDiff] = []
-    for file_diff in files:
-        path = file_diff.path
-        if includes and not any(fnmatch.fnmatch(path, pattern) for pattern in includes):
-            continue
-        if excludes and any(fnmatch.fnmatch(path, pattern) for pattern in excludes):
-            continue
-        filtered.append(file_diff)
-    return filtered
-
-
-def _prepare_bundle_destination(out: Path, zip_requested: bool) -> tuple[Path, Path | None]:
-    out_path = out.resolve()
-    if not zip_requested:
-        return out_path, None
-    zip_path = out_path if out_path.suffix == ".zip" else out_path.with_suffix(".zip")
-    temp_root = Path(tempfile.mkdtemp(prefix="diff-ai-bundle-"))
-    return temp_root, zip_path
+    if include_re is None and exclude_re is None:
+        return list(files)
+    return [
+        file_diff
+        for file_diff in files
+        if _path_selected(file_diff.path, include_re=include_re, exclude_re=exclude_re)
+    ]
+
+
+def _select_diff_segments(
+    diff_text: str,
+    *,
+    include_re: re.Pattern[str] | None,
+    exclude_re: re.Pattern[str] | None,
+) -> str:
+    if include_re is None and exclude_re is None:
+        return diff_text
+    # Drop whole `diff --git` sections before parsing when neither header path can
+    # survive filtering. Headers with unusual paths (quoted, spaces, no a/ b/ prefix)
+    # are kept and left to _filter_files, which sees the parsed paths.
+    headers = list(re.finditer(r"^diff --git (?:a/(\S+) b/(\S+)$)?", diff_text, re.MULTILINE))
+    if not headers:
+        return diff_text
+    segments = [diff_text[: headers[0].start()]]
+    ends = [header.start() for header in headers[1:]] + [len(diff_text)]
+    for header, end in zip(headers, ends, strict=True):
+        old_path, new_path = header.groups()
+        if (
+            old_path is None
+            or new_path is None
+            or _path_selected(old_path, include_re=include_re, exclude_re=exclude_re)
+            or _path_selected(new_path, include_re=include_re, exclude_re=exclude_re)
+        ):
+            segments.append(diff_text[header.start() : end])
+    return "".join(segments)
+
+
+def _path_selected(
+    path: str,
+    *,
+    include_re: re.Pattern[str] | None,
+    exclude_re: re.Pattern[str] | None,
+) -> bool:
+    if include_re is not None and include_re.match(path) is None:
+        return False
+    return exclude_re is None or exclude_re.match(path) is None
+
+
+def _print_json(payload: dict[str, Any]) -> None:
+    text = json.dumps(payload)
+    stream = sys.stdout
+    # json.dumps output is ASCII, so a plain text stream whose encoding maps ASCII to
+    # itself can take the bytes directly. Replaced or wrapped streams (StringIO,
+    # redirectors, other encodings) go through write() so their text layer still applies.
+    if type(stream) is not io.TextIOWrapper or "\n".encode(stream.encoding) != b"\n":
+        stream.write(text + "\n")
+        return
+    # The text layer is flushed first so anything printed earlier keeps its order. The
+    # compact JSON holds no raw newlines, so only the trailing one needs the text layer's
+    # newline translation (e.g. "\r\n" on Windows).
+    stream.flush()
+    stream.buffer.write(text.encode("ascii"))
+    stream.write("\n")
 
 
 def _build_json_payload(
@@ -862,21 +1019,19 @@ def _build_json_payload(
     plugin_runs: list[PluginRun] | None = None,
     review_mode: str | None = None,
 ) -> dict[str, Any]:
-    meta: dict[str, Any] = {
-        "generated_at": datetime.now(tz=UTC)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z"),
-        "base": base,
-        "head": head,
-        "input_source": input_source,
-        "version": __version__,
-    }
+    meta = _META_PROTOTYPE.copy()
+    meta["generated_at"] = datetime.now(tz=UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    meta["base"] = base
+    meta["head"] = head
+    meta["input_source"] = input_source
     if plugin_runs is not None:
         meta["plugins"] = [run.to_dict() for run in plugin_runs]
     if review_mode is not None:
         meta["review_mode"] = review_mode
 
+    # File and hunk findings are the same objects as result.findings, so each one is
+    # converted once and its dict is shared by every list it appears in.
+    finding_dicts = {id(item): _serialize_finding(item) for item in result.findings}
     return {
         "overall_score": result.overall_score,
         "final_score_0_100": result.final_score_0_100,
@@ -885,13 +1040,18 @@ def _build_json_payload(
         "capped_points_by_category": result.capped_points_by_category,
         "transformed_score": result.transformed_score,
         "reasons_topN": result.reasons_topN,
-        "files": [_serialize_file(item) for item in result.files],
-        "findings": [_serialize_finding(item) for item in result.findings],
+        "files": [_serialize_file(item, finding_dicts) for item in result.files],
+        "findings": [finding_dicts[id(item)] for item in result.findings],
         "meta": meta,
     }
 
 
-def _serialize_file(file_score: FileScore) -> dict[str, Any]:
+def _serialize_file(
+    file_score: FileScore, finding_dicts: dict[int, dict[str, Any]]
+) -> dict[str, Any]:
+    # Serialized findings are never empty, so a cache miss falls through the `or`.
+    cached = finding_dicts.get
+    serialize = _serialize_finding
     return {
         "path": file_score.path,
         "score": file_score.score,
@@ -899,11 +1059,11 @@ def _serialize_file(file_score: FileScore) -> dict[str, Any]:
             {
                 "header": hunk.header,
                 "score": hunk.score,
-                "findings": [_serialize_finding(item) for item in hunk.findings],
+                "findings": [cached(id(item)) or serialize(item) for item in hunk.findings],
             }
             for hunk in file_score.hunks
         ],
-        "findings": [_serialize_finding(item) for item in file_score.findings],
+        "findings": [cached(id(item)) or serialize(item) for item in file_score.findings],
     }
 
 
@@ -926,33 +1086,35 @@ def _render_human(result: ScoreResult) -> str:
     if top_findings:
         lines.append("Top reasons:")
         for index, finding in enumerate(top_findings, start=1):
-            points = f"+{finding.points}" if finding.points >= 0 else str(finding.points)
-            lines.append(f"{index}. [{finding.rule_id}] {points} {finding.message}")
-            lines.append(f"   evidence: {finding.evidence}")
-            lines.append(f"   follow-up: {finding.suggestion}")
+            lines += (
+                f"{index}. [{finding.rule_id}] {finding.points:+d} {finding.message}",
+                f"   evidence: {finding.evidence}",
+                f"   follow-up: {finding.suggestion}",
+            )
 
     if result.files:
         lines.append("Per-file summary:")
-        for file_score in sorted(result.files, key=lambda item: item.score, reverse=True):
-            lines.append(
-                f"- {file_score.path}: {file_score.score}/100, "
-                f"{len(file_score.hunks)} hunks, {len(file_score.findings)} findings"
-            )
+        rows = [
+            (file_score.score, file_score.path, len(file_score.hunks), len(file_score.findings))
+            for file_score in result.files
+        ]
+        rows.sort(key=itemgetter(0), reverse=True)
+        lines.extend(
+            f"- {path}: {score}/100, {hunk_count} hunks, {finding_count} findings"
+            for score, path, hunk_count, finding_count in rows
+        )
     return "\n".join(lines)
 
 
 def _top_risk_findings(findings: list[Finding], limit: int) -> list[Finding]:
-    positive = [finding for finding in findings if finding.points > 0]
-    ranked = sorted(positive if positive else findings, key=lambda item: item.points, reverse=True)
-    return ranked[:limit]
+    by_points = attrgetter("points")
+    positive = (finding for finding in findings if finding.points > 0)
+    top = heapq.nlargest(limit, positive, key=by_points)
+    return top or heapq.nlargest(limit, findings, key=by_points)
 
 
 def _score_severity(score: int) -> str:
-    if score >= 75:
-        return "HIGH"
-    if score >= 40:
-        return "MEDIUM"
-    return "LOW"
+    return _SEVERITY_LABELS[bisect_right(_SEVERITY_THRESHOLDS, score)]
 
 
 if __name__ == "__main__":
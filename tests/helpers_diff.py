@@ -0,0 +1,37 @@
+"""Helpers for building synthetic unified diffs in tests."""
+
+from __future__ import annotations
+
+
+def build_replace_diff(path: str, old_lines: list[str], new_lines: list[str]) -> str:
+    old_count = len(old_lines)
+    new_count = len(new_lines)
+    header = [
+        f"diff --git a/{path} b/{path}",
+        "index 1111111..2222222 100644",
+        f"--- a/{path}",
+        f"+++ b/{path}",
+        f"@@ -1,{old_count} +1,{new_count} @@",
+    ]
+    text = "\n".join(header)
+    if old_lines:
+        text += "\n-" + "\n-".join(old_lines)
+    if new_lines:
+        text += "\n+" + "\n+".join(new_lines)
+    return text
+
+
+def build_delete_diff(path: str, old_lines: list[str]) -> str:
+    old_count = len(old_lines)
+    header = [
+        f"diff --git a/{path} b/{path}",
+        "deleted file mode 100644",
+        "index 1111111..0000000",
+        f"--- a/{path}",
+        "+++ /dev/null",
+        f"@@ -1,{old_count} +0,0 @@",
+    ]
+    text = "\n".join(header)
+    if old_lines:
+        text += "\n-" + "\n-".join(old_lines)
+    return text
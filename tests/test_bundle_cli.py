@@ -98,4 +98,7 @@ def test_bundle_command_writes_zip_when_requested(tmp_path: Path) -> None:
 
     with zipfile.ZipFile(out_zip) as archive:
         names = set(archive.namelist())
+        patch_text = archive.read("patch.diff").decode("utf-8")
     assert {"findings.json", "findings.md", "patch.diff", "prompt.md"} <= names
+    assert "+VALUE=2" in patch_text
+    assert not (tmp_path / "handoff").exists()
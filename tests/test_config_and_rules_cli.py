@@ -246,6 +246,40 @@ def test_score_uses_config_defaults_for_format_fail_and_rule_selection(tmp_path:
     assert {item["rule_id"] for item in payload["findings"]} == {"critical_paths"}
 
 
+def test_score_applies_config_include_and_exclude_globs(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / ".diff-ai.toml").write_text(
+        "\n".join(
+            [
+                'format = "json"',
+                'include = ["src/*", "lib/*.py"]',
+                'exclude = ["src/generated_*"]',
+            ]
+        ),
+        encoding="utf-8",
+    )
+    diff_text = "\n".join(
+        "\n".join(
+            [
+                f"diff --git a/{path} b/{path}",
+                "index 1111111..2222222 100644",
+                f"--- a/{path}",
+                f"+++ b/{path}",
+                "@@ -1 +1 @@",
+                "-a = 1",
+                "+a = 2",
+            ]
+        )
+        for path in ["src/app.py", "src/generated_api.py", "lib/util.py", "docs/guide.md"]
+    )
+
+    result = invoke_cli(["score", "--repo", str(repo), "--stdin"], input_text=diff_text)
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert [item["path"] for item in payload["files"]] == ["src/app.py", "lib/util.py"]
+
+
 def test_prompt_uses_llm_defaults_from_config(tmp_path: Path) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
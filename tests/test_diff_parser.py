@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from diff_ai.diff_parser import parse_unified_diff
+from diff_ai.diff_parser import parse_unified_diff, parse_unified_diff_stream
 
 FIXTURE_DIR = Path(__file__).parent / "fixtures" / "diffs"
 
@@ -58,6 +58,27 @@ def test_parse_new_and_deleted_files() -> None:
     assert [line.new_lineno for line in new_file.hunks[0].lines] == [1, 2]
 
 
+def test_stream_parser_yields_each_file_before_reading_the_next() -> None:
+    lines = _load_fixture("new_and_deleted.diff").splitlines()
+    consumed = 0
+
+    def counted_lines():
+        nonlocal consumed
+        for line in lines:
+            consumed += 1
+            yield line
+
+    stream = parse_unified_diff_stream(counted_lines())
+    first = next(stream)
+    assert first.path == "tests/legacy.txt"
+    assert len(first.hunks) == 1
+    assert consumed < len(lines)
+
+    rest = list(stream)
+    assert [file_diff.path for file_diff in rest] == ["docs/new.md"]
+    assert consumed == len(lines)
+
+
 def test_parse_no_newline_marker() -> None:
     parsed = parse_unified_diff(_load_fixture("no_newline_marker.diff"))
     assert len(parsed) == 1
@@ -86,6 +107,28 @@ def test_parse_unified_without_diff_git_header() -> None:
     assert (hunk.old_start, hunk.old_count, hunk.new_start, hunk.new_count) == (5, 1, 5, 1)
 
 
+def test_file_stats_are_computed_once_per_file() -> None:
+    diff_text = "\n".join(
+        [
+            "--- a/src/worker.py",
+            "+++ b/src/worker.py",
+            "@@ -1,3 +1,3 @@",
+            " try:",
+            "-    raise ValueError('bad')",
+            "-    assert ready",
+            "+    run()",
+            "+except:",
+        ]
+    )
+    file_diff = parse_unified_diff(diff_text)[0]
+    stats = file_diff.stats
+    assert (stats.hunk_count, stats.added_lines, stats.deleted_lines) == (1, 2, 2)
+    assert stats.changed_lines == 4
+    assert stats.bare_except_adds == 1
+    assert stats.removed_guard_deletes == 2
+    assert file_diff.stats is stats
+
+
 def test_invalid_hunk_header_raises() -> None:
     with pytest.raises(ValueError, match="Invalid hunk header"):
         parse_unified_diff(
@@ -8,6 +8,12 @@ from diff_ai.scoring import score_diff_text
 from tests.helpers_git import build_numbered_lines, commit_all, git, init_repo, write_file
 
 
+def test_init_repo_configures_commit_identity(tmp_path) -> None:
+    repo = init_repo(tmp_path)
+    assert git(repo, "config", "--get", "user.email").strip() == "test@example.com"
+    assert git(repo, "config", "--get", "user.name").strip() == "Test"
+
+
 def test_golden_magnitude_from_real_git_diff(tmp_path) -> None:
     repo = init_repo(tmp_path)
     write_file(repo, "src/core.py", build_numbered_lines("old", 220))
@@ -60,8 +66,10 @@ def test_golden_test_signals_when_src_changes_without_tests(tmp_path) -> None:
     diff_text = git(repo, "diff", "--no-color")
     result = score_diff_text(diff_text)
 
-    findings = [item for item in result.findings if item.rule_id == "test_signals"]
-    assert any(item.points == 24 and item.scope == "overall" for item in findings)
+    assert any(
+        item.rule_id == "test_signals" and item.points == 24 and item.scope == "overall"
+        for item in result.findings
+    )
     assert 40 <= result.overall_score <= 70
 
 
@@ -75,9 +83,11 @@ def test_test_signals_trigger_when_tests_deleted(tmp_path) -> None:
     diff_text = git(repo, "diff", "--no-color")
     result = score_diff_text(diff_text)
 
-    findings = [item for item in result.findings if item.rule_id == "test_signals"]
     assert any(
-        item.scope == "file:tests/test_service.py" and item.points == 16 for item in findings
+        item.rule_id == "test_signals"
+        and item.scope == "file:tests/test_service.py"
+        and item.points == 16
+        for item in result.findings
     )
 
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from diff_ai.config import (
     ProfileConfig,
     ProfilePathSignal,
@@ -18,6 +20,7 @@ from diff_ai.rules.destructive_changes import DestructiveChangesRule
 from diff_ai.rules.docs_only import DocsOnlyRule
 from diff_ai.rules.error_handling import ErrorHandlingRule
 from diff_ai.rules.profile_signals import ProfileSignalsRule
+from tests.helpers_diff import build_delete_diff, build_replace_diff
 
 
 def test_default_rules_use_feature_oneshot_pack_defaults() -> None:
@@ -39,9 +42,9 @@ def test_security_strict_objective_includes_security_pack_rules() -> None:
 def test_dependency_changes_rule_flags_manifests_and_lockfiles() -> None:
     diff_text = "\n".join(
         [
-            _build_replace_diff("pyproject.toml", ['version = "0.1.0"'], ['version = "0.2.0"']),
-            _build_replace_diff("requirements.txt", ["typer==0.22.0"], ["typer==0.23.1"]),
-            _build_replace_diff("poetry.lock", ["package-a==1.0.0"], ["package-a==1.1.0"]),
+            build_replace_diff("pyproject.toml", ['version = "0.1.0"'], ['version = "0.2.0"']),
+            build_replace_diff("requirements.txt", ["typer==0.22.0"], ["typer==0.23.1"]),
+            build_replace_diff("poetry.lock", ["package-a==1.0.0"], ["package-a==1.1.0"]),
         ]
     )
     findings = DependencyChangesRule().evaluate(parse_unified_diff(diff_text))
@@ -55,8 +58,8 @@ def test_dependency_changes_rule_flags_manifests_and_lockfiles() -> None:
 def test_config_changes_rule_flags_config_and_env_updates() -> None:
     diff_text = "\n".join(
         [
-            _build_replace_diff("config/settings.yml", ["debug: false"], ["debug=true"]),
-            _build_replace_diff(".env", ["API_HOST=127.0.0.1"], ["API_HOST=0.0.0.0"]),
+            build_replace_diff("config/settings.yml", ["debug: false"], ["debug=true"]),
+            build_replace_diff(".env", ["API_HOST=127.0.0.1"], ["API_HOST=0.0.0.0"]),
         ]
     )
     findings = ConfigChangesRule().evaluate(parse_unified_diff(diff_text))
@@ -69,7 +72,7 @@ def test_config_changes_rule_flags_config_and_env_updates() -> None:
 
 
 def test_dangerous_patterns_rule_flags_eval_and_shell_usage() -> None:
-    diff_text = _build_replace_diff(
+    diff_text = build_replace_diff(
         "src/runner.py",
         ["def run(cmd):", "    return cmd"],
         [
@@ -86,7 +89,7 @@ def test_dangerous_patterns_rule_flags_eval_and_shell_usage() -> None:
 
 
 def test_error_handling_rule_flags_bare_except_and_removed_raise() -> None:
-    diff_text = _build_replace_diff(
+    diff_text = build_replace_diff(
         "src/worker.py",
         [
             "try:",
@@ -108,7 +111,7 @@ def test_error_handling_rule_flags_bare_except_and_removed_raise() -> None:
 
 
 def test_api_surface_rule_flags_signature_churn_in_api_paths() -> None:
-    diff_text = _build_replace_diff(
+    diff_text = build_replace_diff(
         "src/api/routes.py",
         ["def get_user():", "    return {}"],
         [
@@ -129,8 +132,8 @@ def test_api_surface_rule_flags_signature_churn_in_api_paths() -> None:
 def test_docs_only_rule_reduces_risk_for_docs_diff() -> None:
     diff_text = "\n".join(
         [
-            _build_replace_diff("docs/guide.md", ["old"], ["new"]),
-            _build_replace_diff("README.md", ["line1"], ["line2"]),
+            build_replace_diff("docs/guide.md", ["old"], ["new"]),
+            build_replace_diff("README.md", ["line1"], ["line2"]),
         ]
     )
     findings = DocsOnlyRule().evaluate(parse_unified_diff(diff_text))
@@ -142,8 +145,8 @@ def test_docs_only_rule_reduces_risk_for_docs_diff() -> None:
 def test_destructive_changes_rule_flags_deleted_file_and_deletion_heavy_diff() -> None:
     diff_text = "\n".join(
         [
-            _build_delete_diff("src/legacy.py", [f"line-{idx}" for idx in range(1, 41)]),
-            _build_replace_diff(
+            build_delete_diff("src/legacy.py", [f"line-{idx}" for idx in range(1, 41)]),
+            build_replace_diff(
                 "src/keep.py",
                 [f"old-{idx}" for idx in range(1, 31)],
                 [f"new-{idx}" for idx in range(1, 6)],
@@ -156,7 +159,7 @@ def test_destructive_changes_rule_flags_deleted_file_and_deletion_heavy_diff() -
 
 
 def test_profile_signals_rule_flags_paths_patterns_and_missing_tests() -> None:
-    diff_text = _build_replace_diff(
+    diff_text = build_replace_diff(
         "src/payments/charge.py",
         ["def run(cmd):", "    return cmd"],
         ["def run(cmd):", "    eval(cmd)", "    return cmd"],
@@ -189,29 +192,46 @@ def test_profile_signals_rule_flags_paths_patterns_and_missing_tests() -> None:
     assert any("requires tests" in finding.message.lower() for finding in findings)
 
 
-def _build_replace_diff(path: str, old_lines: list[str], new_lines: list[str]) -> str:
-    old_count = len(old_lines)
-    new_count = len(new_lines)
-    header = [
-        f"diff --git a/{path} b/{path}",
-        "index 1111111..2222222 100644",
-        f"--- a/{path}",
-        f"+++ b/{path}",
-        f"@@ -1,{old_count} +1,{new_count} @@",
-    ]
-    body = [f"-{line}" for line in old_lines] + [f"+{line}" for line in new_lines]
-    return "\n".join(header + body)
-
-
-def _build_delete_diff(path: str, old_lines: list[str]) -> str:
-    old_count = len(old_lines)
-    header = [
-        f"diff --git a/{path} b/{path}",
-        "deleted file mode 100644",
-        "index 1111111..0000000",
-        f"--- a/{path}",
-        "+++ /dev/null",
-        f"@@ -1,{old_count} +0,0 @@",
-    ]
-    body = [f"-{line}" for line in old_lines]
-    return "\n".join(header + body)
+def test_profile_signals_rule_reports_every_pattern_matching_one_line() -> None:
+    diff_text = build_replace_diff(
+        "src/runner.py",
+        ["run(cmd)"],
+        ["eval(cmd); subprocess.run(cmd, shell=True)", "x = 1"],
+    )
+    rule = ProfileSignalsRule(
+        ProfileConfig(
+            unsafe_added=[
+                ProfilePatternSignal(regex=r"\beval\(", points=12, reason="eval usage"),
+                ProfilePatternSignal(regex=r"shell\s*=\s*True", points=10, reason="shell"),
+                ProfilePatternSignal(regex=r"pickle\.loads", points=9, reason="pickle"),
+            ]
+        )
+    )
+    findings = rule.evaluate(parse_unified_diff(diff_text))
+    assert sorted(finding.points for finding in findings) == [10, 12]
+
+
+def test_profile_signals_rule_accepts_test_change_matching_any_glob() -> None:
+    diff_text = "\n".join(
+        [
+            build_replace_diff("src/payments/charge.py", ["a = 1"], ["a = 2"]),
+            build_replace_diff("spec/charge_spec.py", ["b = 1"], ["b = 2"]),
+        ]
+    )
+    rule = ProfileSignalsRule(
+        ProfileConfig(
+            tests=ProfileTestsConfig(
+                required_for=["docs/**", "src/payments/**"],
+                test_globs=["tests/**", "spec/*_spec.py"],
+            )
+        )
+    )
+    assert rule.evaluate(parse_unified_diff(diff_text)) == []
+
+
+def test_profile_signals_rule_rejects_invalid_regex() -> None:
+    profile = ProfileConfig(
+        unsafe_added=[ProfilePatternSignal(regex="eval(", points=12, reason="eval usage")]
+    )
+    with pytest.raises(ValueError, match="Invalid profile.patterns.unsafe_added regex"):
+        ProfileSignalsRule(profile)
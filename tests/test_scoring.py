@@ -9,13 +9,14 @@ from diff_ai.rules.base import Finding
 from diff_ai.rules.critical_paths import CriticalPathsRule
 from diff_ai.rules.magnitude import MagnitudeRule
 from diff_ai.rules.test_signals import TestSignalsRule
-from diff_ai.scoring import score_diff_text, score_files
+from diff_ai.scoring import parse_scope, score_diff_text, score_files
+from tests.helpers_diff import build_replace_diff
 
 
 def test_magnitude_rule_flags_large_file_churn() -> None:
     old_lines = [f"old-{idx}" for idx in range(1, 91)]
     new_lines = [f"new-{idx}" for idx in range(1, 91)]
-    diff_text = _build_replace_diff("src/core.py", old_lines, new_lines)
+    diff_text = build_replace_diff("src/core.py", old_lines, new_lines)
 
     findings = MagnitudeRule().evaluate(parse_unified_diff(diff_text))
     scopes = {finding.scope for finding in findings}
@@ -31,10 +32,10 @@ def test_magnitude_rule_flags_large_file_churn() -> None:
 def test_critical_paths_rule_matches_sensitive_paths() -> None:
     diff_text = "\n".join(
         [
-            _build_replace_diff("src/auth/service.py", ["a"], ["b"]),
-            _build_replace_diff("src/billing/invoice.py", ["a"], ["b"]),
-            _build_replace_diff("db/migrations/20260214_add_table.sql", ["a"], ["b"]),
-            _build_replace_diff(".github/workflows/release.yml", ["a"], ["b"]),
+            build_replace_diff("src/auth/service.py", ["a"], ["b"]),
+            build_replace_diff("src/billing/invoice.py", ["a"], ["b"]),
+            build_replace_diff("db/migrations/20260214_add_table.sql", ["a"], ["b"]),
+            build_replace_diff(".github/workflows/release.yml", ["a"], ["b"]),
         ]
     )
     findings = CriticalPathsRule().evaluate(parse_unified_diff(diff_text))
@@ -49,7 +50,7 @@ def test_critical_paths_rule_matches_sensitive_paths() -> None:
 
 
 def test_test_signals_rule_penalizes_code_without_tests() -> None:
-    diff_text = _build_replace_diff("src/feature.py", ["a", "b"], ["c", "d"])
+    diff_text = build_replace_diff("src/feature.py", ["a", "b"], ["c", "d"])
     findings = TestSignalsRule().evaluate(parse_unified_diff(diff_text))
     assert len(findings) == 1
     assert findings[0].scope == "overall"
@@ -59,8 +60,8 @@ def test_test_signals_rule_penalizes_code_without_tests() -> None:
 def test_test_signals_rule_rewards_test_updates() -> None:
     diff_text = "\n".join(
         [
-            _build_replace_diff("src/feature.py", ["a"], ["b"]),
-            _build_replace_diff("tests/test_feature.py", ["x"], ["y"]),
+            build_replace_diff("src/feature.py", ["a"], ["b"]),
+            build_replace_diff("tests/test_feature.py", ["x"], ["y"]),
         ]
     )
     findings = TestSignalsRule().evaluate(parse_unified_diff(diff_text))
@@ -72,7 +73,7 @@ def test_test_signals_rule_rewards_test_updates() -> None:
 def test_score_diff_text_aggregates_default_rules() -> None:
     old_lines = [f"old-{idx}" for idx in range(1, 36)]
     new_lines = [f"new-{idx}" for idx in range(1, 36)]
-    diff_text = _build_replace_diff("src/auth/service.py", old_lines, new_lines)
+    diff_text = build_replace_diff("src/auth/service.py", old_lines, new_lines)
 
     result = score_diff_text(diff_text)
     assert result.overall_score > 0
@@ -87,7 +88,7 @@ def test_score_diff_text_aggregates_default_rules() -> None:
 
 
 def test_score_uses_capped_diminishing_model_for_overall_score() -> None:
-    files = parse_unified_diff(_build_replace_diff("src/a.py", ["a"], ["b"]))
+    files = parse_unified_diff(build_replace_diff("src/a.py", ["a"], ["b"]))
     result = score_files(files, rules=[_MaxRule()])
     assert 0 < result.overall_score < 100
     assert result.overall_score == result.final_score_0_100
@@ -96,9 +97,36 @@ def test_score_uses_capped_diminishing_model_for_overall_score() -> None:
     assert result.capped_points_by_category["unknown"] == 20
 
 
+def test_score_files_attributes_hunk_findings_to_existing_hunks_only() -> None:
+    files = parse_unified_diff(build_replace_diff("src/a.py", ["a"], ["b"]))
+    result = score_files(files, rules=[_HunkRule()])
+    (file_score,) = result.files
+    assert file_score.score == 15
+    assert [hunk.score for hunk in file_score.hunks] == [5]
+    assert len(file_score.hunks[0].findings) == 1
+
+
+def test_score_files_uses_custom_rule_category_without_leaking_it() -> None:
+    files = parse_unified_diff(build_replace_diff("src/a.py", ["a"], ["b"]))
+    custom = score_files(files, rules=[_MaxRule(category="security")])
+    assert custom.raw_points_by_category["security"] == 500
+    default = score_files(files, rules=[_MaxRule()])
+    assert default.raw_points_by_category["unknown"] == 500
+
+
+def test_parse_scope_handles_all_scope_forms() -> None:
+    assert parse_scope("overall") == ("overall", "", None)
+    assert parse_scope("file:src/a.py") == ("file", "src/a.py", None)
+    assert parse_scope("hunk:src/a.py:2") == ("hunk", "src/a.py", 2)
+    assert parse_scope("hunk:src/a.py") == ("file", "src/a.py", None)
+    assert parse_scope("hunk:src/a:b.py:x") == ("file", "src/a:b.py", None)
+    assert parse_scope("repo") == ("overall", "", None)
+
+
 @dataclass(slots=True)
 class _MaxRule:
     rule_id: str = "max_rule"
+    category: str = ""
 
     def evaluate(self, files: list[FileDiff]) -> list[Finding]:
         _ = files
@@ -114,15 +142,20 @@ class _MaxRule:
         ]
 
 
-def _build_replace_diff(path: str, old_lines: list[str], new_lines: list[str]) -> str:
-    old_count = len(old_lines)
-    new_count = len(new_lines)
-    header = [
-        f"diff --git a/{path} b/{path}",
-        "index 1111111..2222222 100644",
-        f"--- a/{path}",
-        f"+++ b/{path}",
-        f"@@ -1,{old_count} +1,{new_count} @@",
-    ]
-    body = [f"-{line}" for line in old_lines] + [f"+{line}" for line in new_lines]
-    return "\n".join(header + body)
+@dataclass(slots=True)
+class _HunkRule:
+    rule_id: str = "hunk_rule"
+
+    def evaluate(self, files: list[FileDiff]) -> list[Finding]:
+        return [
+            Finding(
+                rule_id=self.rule_id,
+                points=5,
+                message="Hunk risk",
+                evidence="Synthetic finding",
+                scope=f"hunk:{file_diff.path}:{index}",
+                suggestion="N/A",
+            )
+            for file_diff in files
+            for index in (0, 1, -1)
+        ]
@@ -57,6 +57,52 @@ def test_deterministic_same_hits_same_result() -> None:
     assert baseline == repeated
 
 
+def test_category_labels_are_normalized_consistently_across_calls() -> None:
+    labels = [" Security ", "QUALITY", "profile", "made-up", ""]
+    hits = [
+        RuleHit(id=f"rule_{idx}", category=label, points=3, scope="global", message="hit")
+        for idx, label in enumerate(labels)
+    ]
+
+    first = score_rule_hits(hits)
+    second = score_rule_hits(hits)
+
+    assert first == second
+    assert first.raw_points_by_category["security"] == 3
+    assert first.raw_points_by_category["style"] == 3
+    assert first.raw_points_by_category["integration"] == 3
+    assert first.raw_points_by_category["unknown"] == 6
+    assert any("[security]" in reason for reason in first.reasons_topN)
+
+
+def test_reasons_format_points_category_and_scope() -> None:
+    hits = [
+        RuleHit(id="a", category="logic", points=9, scope="global", message="global hit"),
+        RuleHit(id="b", category="logic", points=7, scope="file", file_path="x.py", message="file"),
+        RuleHit(
+            id="c",
+            category="logic",
+            points=5,
+            scope="hunk",
+            file_path="x.py",
+            hunk_id=2,
+            message="hunk",
+        ),
+        RuleHit(id="d", category="logic", points=3, scope="hunk", hunk_id=0, message="orphan"),
+    ]
+
+    assert score_rule_hits(hits).reasons_topN == [
+        "[a] +9 [logic] global hit",
+        "[b] +7 [logic] file (x.py)",
+        "[c] +5 [logic] hunk (x.py, hunk 2)",
+        "[d] +3 [logic] orphan (hunk 0)",
+    ]
+    negative = score_rule_hits(
+        [RuleHit(id="t", category="test_adequacy", points=-8, scope="global", message="tests")]
+    )
+    assert negative.reasons_topN == ["[t] -8 [test_adequacy] tests"]
+
+
 def test_magnitude_rule_cap_reduces_multi_scope_accumulation() -> None:
     hits = [
         RuleHit(
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import io
 import json
+import sys
 from pathlib import Path
 
+import pytest
+
 from diff_ai import __version__
 from diff_ai.standalone import main
 
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "diffs"
+
 
 def test_standalone_version_flag(capsys) -> None:
     exit_code = main(["--version"])
@@ -17,8 +23,19 @@ def test_standalone_version_flag(capsys) -> None:
     assert captured.out.strip() == __version__
 
 
+def test_standalone_help_renders_identically_when_repeated(capsys) -> None:
+    outputs = []
+    for _ in range(2):
+        with pytest.raises(SystemExit):
+            main(["score", "--help"])
+        outputs.append(capsys.readouterr().out)
+
+    assert outputs[0] == outputs[1]
+    assert "--fail-above" in outputs[0]
+
+
 def test_standalone_score_json_from_diff_file(capsys) -> None:
-    diff_path = Path("tests/fixtures/diffs/simple.diff")
+    diff_path = FIXTURE_DIR / "simple.diff"
     exit_code = main(["score", "--diff-file", str(diff_path), "--format", "json"])
     captured = capsys.readouterr()
 
@@ -27,3 +44,42 @@ def test_standalone_score_json_from_diff_file(capsys) -> None:
     assert {"overall_score", "files", "findings", "meta", "final_score_0_100"} <= set(
         payload.keys()
     )
+
+
+def test_standalone_json_respects_replaced_stdout_encoding(monkeypatch) -> None:
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-16")
+    monkeypatch.setattr(sys, "stdout", stream)
+
+    exit_code = main(["score", "--diff-file", str(FIXTURE_DIR / "simple.diff"), "--format", "json"])
+    stream.flush()
+
+    assert exit_code == 0
+    payload = json.loads(raw.getvalue().decode("utf-16"))
+    assert "overall_score" in payload
+
+
+def test_standalone_json_on_plain_text_stdout_keeps_order_and_newlines(monkeypatch) -> None:
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8", newline="\r\n")
+    monkeypatch.setattr(sys, "stdout", stream)
+
+    print("before")
+    exit_code = main(["score", "--diff-file", str(FIXTURE_DIR / "simple.diff"), "--format", "json"])
+    stream.flush()
+
+    assert exit_code == 0
+    output = raw.getvalue()
+    assert output.startswith(b"before\r\n{")
+    assert output.endswith(b"}\r\n")
+    assert output.count(b"\n") == 2
+    assert "overall_score" in json.loads(output[len(b"before\r\n") :])
+
+
+def test_standalone_usage_error_lists_every_command(capsys) -> None:
+    with pytest.raises(SystemExit):
+        main(["score", "--not-an-option"])
+    err = capsys.readouterr().err
+
+    assert "unrecognized arguments: --not-an-option" in err
+    assert "{score,explain,prompt,bundle,rules,plugins,config,config-init,config-validate}" in err